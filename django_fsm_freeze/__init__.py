@@ -1 +1,13 @@
-from .models import FreezableFSMModelMixin, bypass_fsm_freeze  # noqa:F401
+from typing import Any
+
+__all__ = ['FreezableFSMModelMixin', 'bypass_fsm_freeze', 'lock_fsm_freeze']
+
+
+def __getattr__(name: str) -> Any:
+    # Imported lazily, so that the package can be an installed app (for its
+    # management commands) without importing models before apps are loaded.
+    if name in __all__:
+        from django_fsm_freeze import models
+
+        return getattr(models, name)
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
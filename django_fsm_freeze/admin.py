@@ -0,0 +1,59 @@
+from django.contrib import admin
+
+
+class FsmFrozenListFilter(admin.SimpleListFilter):
+    """Filter the changelist on frozeness, evaluated in SQL."""
+
+    title = 'frozen'
+    parameter_name = 'fsm_frozen'
+
+    def lookups(self, request, model_admin):
+        return (('1', 'Yes'), ('0', 'No'))
+
+    def queryset(self, request, queryset):
+        if self.value() in ('0', '1'):
+            return queryset.filter(_fsm_frozen=self.value() == '1')
+        return queryset
+
+
+class FreezableModelAdmin(admin.ModelAdmin):
+    """
+    ModelAdmin of FreezableFSMModelMixin models.
+
+    The frozeness of the rows is annotated in the queryset (in one query,
+    following FROZEN_DELEGATE_TO), and the frozen fields of a frozen
+    instance are read-only in its change form.
+    """
+
+    list_display = ('__str__', 'fsm_frozen')
+    list_filter = (FsmFrozenListFilter,)
+
+    def get_queryset(self, request):
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(_fsm_frozen=self.model.fsm_frozen_expression())
+        )
+
+    @admin.display(boolean=True, description='frozen', ordering='_fsm_frozen')
+    def fsm_frozen(self, obj) -> bool:
+        return self._is_fsm_frozen(obj)
+
+    def get_readonly_fields(self, request, obj=None):
+        readonly_fields = tuple(super().get_readonly_fields(request, obj))
+        if obj is None or not self._is_fsm_frozen(obj):
+            return readonly_fields
+        frozen_field_names = obj.get_fsm_frozen_field_names()
+        return readonly_fields + tuple(
+            field.name
+            for field in obj._meta.concrete_fields
+            if field.name in frozen_field_names
+            and field.editable
+            and not field.auto_created
+            and field.name not in readonly_fields
+        )
+
+    @staticmethod
+    def _is_fsm_frozen(obj) -> bool:
+        frozen = getattr(obj, '_fsm_frozen', None)
+        return obj.is_fsm_frozen if frozen is None else frozen
@@ -0,0 +1,220 @@
+import json
+import zlib
+from typing import Any, Optional
+
+from django.apps import apps
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections, models, router, transaction
+from django.db.models.deletion import (
+    Collector,
+    ProtectedError,
+    RestrictedError,
+)
+from django.utils import timezone
+from django.utils.encoding import is_protected_type
+
+from django_fsm_freeze.exceptions import (
+    FreezeConfigurationError,
+    FreezeValidationError,
+)
+from django_fsm_freeze.querysets import _READONLY_FSM_MODEL
+
+
+class AbstractFrozenArchive(models.Model):
+    """
+    Append-only archive of frozen rows, stored as (compressed) JSON.
+
+    Subclass it in your app and point the FROZEN_ARCHIVE_MODEL of the
+    archived models to it.
+    """
+
+    class Meta:
+        abstract = True
+        constraints = [
+            models.UniqueConstraint(
+                fields=('model', 'object_pk'),
+                name='%(app_label)s_%(class)s_unique_object',
+            )
+        ]
+
+    model = models.CharField(max_length=255)
+    object_pk = models.CharField(max_length=255)
+    archived_at = models.DateTimeField(default=timezone.now)
+    compressed = models.BooleanField(default=False)
+    payload = models.BinaryField()
+
+    def save(self, *args, **kwargs) -> None:
+        if not self._state.adding:
+            raise FreezeValidationError(
+                f'{self!r} is append-only, cannot be saved.'
+            )
+        return super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise FreezeValidationError(
+            f'{self!r} is append-only, cannot be deleted.'
+        )
+
+    @classmethod
+    def dump(cls, obj: models.Model, compress: bool = False):
+        """Build the archive of obj (as Django's serializers would)."""
+
+        data = {}
+        for field in obj._meta.concrete_fields:
+            value = field.value_from_object(obj)
+            data[field.attname] = (
+                value
+                if is_protected_type(value)
+                else field.value_to_string(obj)
+            )
+        payload = json.dumps(data, cls=DjangoJSONEncoder).encode()
+        return cls(
+            model=obj._meta.label,
+            object_pk=str(obj.pk),
+            compressed=compress,
+            payload=zlib.compress(payload) if compress else payload,
+        )
+
+    def load(self) -> dict:
+        """The archived field values, by attname."""
+
+        payload = bytes(self.payload)
+        if self.compressed:
+            payload = zlib.decompress(payload)
+        return json.loads(payload)
+
+
+def get_archive_model(model) -> type[AbstractFrozenArchive]:
+    if not (model.FROZEN_ARCHIVE_MODEL and model.FROZEN_ARCHIVE_IN_STATES):
+        raise FreezeConfigurationError(
+            {
+                'FROZEN_ARCHIVE_MODEL': [
+                    f'Archiving is not configured on {model!r}.'
+                ]
+            }
+        )
+    return apps.get_model(model.FROZEN_ARCHIVE_MODEL)
+
+
+def get_archived(model, pk: Any, using: Optional[str] = None):
+    """
+    Rebuild the archived instance of model with pk, or None.
+
+    The instance is read-only (see `FreezableQuerySet.stream_readonly()`).
+    """
+
+    archive_model = get_archive_model(model)
+    pk = model._meta.pk.to_python(pk)
+    archive = (
+        archive_model._default_manager.using(using)
+        .filter(model=model._meta.label, object_pk=str(pk))
+        .first()
+    )
+    if archive is None:
+        return None
+
+    data = archive.load()
+    fields = model._meta.concrete_fields
+    values = [
+        (
+            field.to_python(data[field.attname])
+            if field.attname in data
+            else field.get_default()
+        )
+        for field in fields
+    ]
+    token = _READONLY_FSM_MODEL.set(model)
+    try:
+        obj = model.from_db(
+            using or router.db_for_read(model),
+            [field.attname for field in fields],
+            values,
+        )
+    finally:
+        _READONLY_FSM_MODEL.reset(token)
+    obj._fsm_frozen = True
+    return obj
+
+
+def archive_frozen(
+    model, batch_size: int = 500, compress: bool = False
+) -> tuple[int, int]:
+    """
+    Move the rows of model in FROZEN_ARCHIVE_IN_STATES to its archive.
+
+    Rows whose deletion would affect other rows (protected, cascading or
+    set to null) are skipped. The archive is expected in the database of
+    model. Return the numbers of archived and skipped rows.
+    """
+
+    archive_model = get_archive_model(model)
+    queryset = model._base_manager.filter(
+        **{
+            f'{model._get_fsm_state_lookup()}__in': (
+                model.FROZEN_ARCHIVE_IN_STATES
+            )
+        }
+    ).order_by('pk')
+    archived = skipped = 0
+    last_pk = None
+    while True:
+        chunk_queryset = queryset
+        if last_pk is not None:
+            chunk_queryset = queryset.filter(pk__gt=last_pk)
+        pks = list(chunk_queryset.values_list('pk', flat=True)[:batch_size])
+        if not pks:
+            break
+        last_pk = pks[-1]
+        moved = _move(queryset, archive_model, pks, compress)
+        if moved is not None:
+            archived += moved
+            continue
+        for pk in pks:
+            moved = _move(queryset, archive_model, [pk], compress)
+            if moved is None:
+                skipped += 1
+            else:
+                archived += moved
+    return archived, skipped
+
+
+def _move(
+    queryset: models.QuerySet, archive_model, pks: list, compress: bool
+) -> Optional[int]:
+    """
+    Archive and delete the rows of pks which are still archivable, and
+    return how many, or None if deleting them would affect other rows.
+
+    The rows are selected again with a lock, in the transaction deleting
+    them: a row edited since the chunk was read is archived as it is now,
+    and one which left the archivable states is kept.
+    """
+
+    using = router.db_for_write(queryset.model)
+    features = connections[using].features
+    with transaction.atomic(using=using):
+        objs = list(
+            queryset.using(using)
+            .filter(pk__in=pks)
+            .select_for_update(
+                of=('self',) if features.has_select_for_update_of else ()
+            )
+        )
+        if not objs:
+            return 0
+        collector = Collector(using=using)
+        try:
+            collector.collect(objs)
+        except (ProtectedError, RestrictedError):
+            return None
+        if (
+            set(collector.data) != {queryset.model}
+            or collector.field_updates
+            or any(qs.exists() for qs in collector.fast_deletes)
+        ):
+            return None
+        archive_model._default_manager.using(using).bulk_create(
+            [archive_model.dump(obj, compress) for obj in objs]
+        )
+        collector.delete()
+    return len(objs)
@@ -0,0 +1,287 @@
+import atexit
+import queue
+import threading
+from typing import Any, Callable, Iterable, Optional, Union
+
+from django.apps import apps
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db import (
+    DatabaseError,
+    close_old_connections,
+    connections,
+    models,
+    transaction,
+)
+from django.dispatch import receiver
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from django_fsm_freeze.exceptions import FreezeConfigurationError
+
+
+class FreezeAuditAction(models.TextChoices):
+    SAVE_VIOLATION = 'save_violation', 'Frozen fields changed'
+    DELETE_VIOLATION = 'delete_violation', 'Frozen object deleted'
+    BYPASS = 'bypass', 'Frozen checks bypassed'
+
+
+# Followed by FreezeValidationError, which rolls the transaction back: not
+# written on commit.
+_VIOLATIONS = frozenset(
+    (FreezeAuditAction.SAVE_VIOLATION, FreezeAuditAction.DELETE_VIOLATION)
+)
+
+
+class AbstractFreezeAuditEvent(models.Model):
+    """
+    Audit log of freeze violations and bypass usage.
+
+    Subclass it in your app and point the `MODEL` key of the
+    `FSM_FREEZE_AUDIT` setting to it.
+    """
+
+    class Meta:
+        abstract = True
+
+    created_at = models.DateTimeField(default=timezone.now)
+    action = models.CharField(max_length=32, choices=FreezeAuditAction.choices)
+    model = models.CharField(max_length=255, blank=True)
+    object_pk = models.CharField(max_length=255, blank=True)
+    fields = models.JSONField(default=list, blank=True)
+    actor = models.CharField(max_length=255, blank=True)
+
+
+class FreezeAuditor:
+    """
+    Buffer audit events in a bounded queue and write them in batches.
+
+    model: the (concrete) AbstractFreezeAuditEvent model
+    mode: when the queue is flushed;
+          'background': by a daemon thread, every `flush_interval` seconds
+                        or as soon as `batch_size` events are queued
+          'on_commit': when the current transaction commits
+          'sync': never queued, each event is written immediately
+    max_queue_size: the bound of the queue
+    batch_size: the number of events per INSERT
+    overflow: what to do when the queue is full;
+              'drop': drop the event
+              'block': wait up to `block_timeout` seconds, then drop it
+    actor: callable (or its dotted path) returning who is acting
+    using: the database the events are written to
+
+    In the 'on_commit' mode, the violations are written by the background
+    thread: the `FreezeValidationError` rolls the current transaction back.
+    In the 'sync' mode, they are written within it. The background thread
+    is stopped, and the queue flushed, at exit.
+
+    Dropped events (including the events of the background thread failing
+    to be written) are counted in `dropped`.
+    """
+
+    MODES = ('background', 'on_commit', 'sync')
+    OVERFLOWS = ('drop', 'block')
+
+    def __init__(
+        self,
+        model: Union[str, type[AbstractFreezeAuditEvent]],
+        mode: str = 'background',
+        max_queue_size: int = 10000,
+        batch_size: int = 500,
+        overflow: str = 'drop',
+        block_timeout: float = 1.0,
+        flush_interval: float = 1.0,
+        actor: Union[str, Callable[[], Any], None] = None,
+        using: Optional[str] = None,
+    ):
+        errors: dict = {}
+        if mode not in self.MODES:
+            errors['MODE'] = [f'{mode!r} is not one of {self.MODES}.']
+        if overflow not in self.OVERFLOWS:
+            errors['OVERFLOW'] = [
+                f'{overflow!r} is not one of {self.OVERFLOWS}.'
+            ]
+        if errors:
+            raise FreezeConfigurationError(errors)
+
+        self.model = apps.get_model(model) if isinstance(model, str) else model
+        self.mode = mode
+        self.batch_size = batch_size
+        self.overflow = overflow
+        self.block_timeout = block_timeout
+        self.flush_interval = flush_interval
+        self.actor = import_string(actor) if isinstance(actor, str) else actor
+        self.using = using
+        self.dropped = 0
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(
+        self,
+        action: str,
+        obj: Union[models.Model, type[models.Model], None] = None,
+        fields: Iterable[str] = (),
+    ) -> None:
+        """
+        Queue an audit event about obj (an instance or a model), or about
+        all objects.
+        """
+
+        event = self.model(
+            created_at=timezone.now(),
+            action=action,
+            model=obj._meta.label if obj is not None else '',
+            object_pk=(
+                str(obj.pk)
+                if isinstance(obj, models.Model) and obj.pk is not None
+                else ''
+            ),
+            fields=sorted(fields),
+            actor=str(self.actor() or '') if self.actor else '',
+        )
+        if self.mode == 'sync':
+            self._write([event])
+            return
+
+        try:
+            self._queue.put(
+                event,
+                block=self.overflow == 'block',
+                timeout=self.block_timeout,
+            )
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            return
+
+        if self.mode == 'on_commit' and action not in _VIOLATIONS:
+            # Once committed, the first callback flushes the whole queue and
+            # the following ones find it empty.
+            transaction.on_commit(self.flush)
+        else:
+            self._start()
+            if self._queue.qsize() >= self.batch_size:
+                self._wakeup.set()
+
+    def flush(self) -> int:
+        """Write the queued events, return how many were written."""
+
+        events = self._drain()
+        if events:
+            self._write(events)
+        return len(events)
+
+    def close(self) -> None:
+        """Stop the background thread and flush the remaining events."""
+
+        thread = self._thread
+        if thread is not None:
+            self._stopped.set()
+            self._wakeup.set()
+            thread.join()
+            self._thread = None
+            atexit.unregister(self.close)
+        self.flush()
+
+    def _drain(self) -> list:
+        events = []
+        while True:
+            try:
+                events.append(self._queue.get_nowait())
+            except queue.Empty:
+                return events
+
+    def _write(self, events: list) -> None:
+        self.model._default_manager.using(self.using).bulk_create(
+            events, batch_size=self.batch_size
+        )
+
+    def _write_or_drop(self, events: list) -> None:
+        try:
+            self._write(events)
+        except DatabaseError:
+            with self._lock:
+                self.dropped += len(events)
+
+    def _start(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._stopped.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name='fsm-freeze-audit', daemon=True
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        try:
+            while not self._stopped.is_set():
+                self._wakeup.wait(self.flush_interval)
+                self._wakeup.clear()
+                events = self._drain()
+                if not events:
+                    continue
+                # As a request would, honouring CONN_MAX_AGE.
+                close_old_connections()
+                try:
+                    self._write_or_drop(events)
+                finally:
+                    close_old_connections()
+        finally:
+            connections.close_all()
+
+
+_UNSET: Any = object()
+_auditor: Optional[FreezeAuditor] = _UNSET
+_auditor_lock = threading.Lock()
+
+
+def get_auditor() -> Optional[FreezeAuditor]:
+    """
+    Build the auditor from the `FSM_FREEZE_AUDIT` setting, if defined.
+
+    The keys of the setting are the upper-cased arguments of FreezeAuditor.
+    """
+
+    global _auditor
+    if _auditor is _UNSET:
+        with _auditor_lock:
+            if _auditor is _UNSET:
+                options = getattr(settings, 'FSM_FREEZE_AUDIT', None)
+                _auditor = (
+                    FreezeAuditor(
+                        **{key.lower(): val for key, val in options.items()}
+                    )
+                    if options
+                    else None
+                )
+    return _auditor
+
+
+def record_freeze_event(
+    action: str,
+    obj: Union[models.Model, type[models.Model], None] = None,
+    fields: Iterable[str] = (),
+) -> None:
+    """Record an audit event, when auditing is enabled."""
+
+    auditor = get_auditor()
+    if auditor is not None:
+        auditor.record(action, obj, fields)
+
+
+@receiver(setting_changed)
+def on_setting_changed(setting, **kwargs):
+    global _auditor
+    if setting != 'FSM_FREEZE_AUDIT':
+        return
+    with _auditor_lock:
+        if isinstance(_auditor, FreezeAuditor):
+            _auditor.close()
+        _auditor = _UNSET
@@ -0,0 +1,121 @@
+from typing import Any, Callable, Optional
+
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.db import models, transaction
+
+from django_fsm_freeze.exceptions import FreezeConfigurationError
+
+
+class FreezableBackfill:
+    """
+    Data migration of a (freezable) model, walking it in chunks ordered by
+    primary key. Usable as the code of `migrations.RunPython`.
+
+    app_label, model_name: the model to migrate
+    update: callable receiving an instance and returning a dict of the
+            field values to update (or an empty dict)
+    chunk_size: the number of instances loaded (and updated) at once
+    get_queryset: callable receiving the model and returning the queryset
+                  to walk (defaults to all the instances)
+    checkpoint_name: the key of the progress in the cache
+    cache_alias: the cache keeping the progress, which must be persistent
+                 (not a local memory nor a dummy cache) to resume across
+                 processes
+
+    Each chunk is written with `bulk_update()` in its own transaction: the
+    frozen checks do not apply, as the historical models of migrations are
+    not FreezableFSMModelMixin models, and `bulk_update()` does not call
+    `save()` anyway. Once committed, the
+    primary key of its last instance is checkpointed: when the migration is
+    interrupted, the next run resumes after it. The migration must then be
+    non-atomic (`atomic = False`), and `update` idempotent, as a chunk is
+    applied again if interrupted before checkpointing.
+
+    Pass `reverse` as the reverse code of `RunPython`: it forgets the
+    progress, so a later run does not skip the rows of a partial run.
+    """
+
+    def __init__(
+        self,
+        app_label: str,
+        model_name: str,
+        update: Callable[[Any], dict],
+        chunk_size: int = 1000,
+        get_queryset: Optional[Callable[[Any], models.QuerySet]] = None,
+        checkpoint_name: Optional[str] = None,
+        cache_alias: str = 'default',
+    ):
+        self.app_label = app_label
+        self.model_name = model_name
+        self.update = update
+        self.chunk_size = chunk_size
+        self.get_queryset = get_queryset
+        self.checkpoint_key = 'fsm-freeze-backfill:' + (
+            checkpoint_name
+            or f'{app_label}.{model_name}:{update.__module__}'
+            f'.{update.__qualname__}'
+        )
+        self.cache_alias = cache_alias
+
+    def __call__(self, apps, schema_editor) -> None:
+        model = apps.get_model(self.app_label, self.model_name)
+        using = schema_editor.connection.alias
+        queryset = (
+            self.get_queryset(model)
+            if self.get_queryset
+            else model._base_manager.all()
+        ).using(using)
+        cache = self._get_cache()
+
+        last_pk = cache.get(self.checkpoint_key)
+        while True:
+            chunk_queryset = queryset.order_by('pk')
+            if last_pk is not None:
+                chunk_queryset = chunk_queryset.filter(pk__gt=last_pk)
+            chunk = list(chunk_queryset[: self.chunk_size])
+            if not chunk:
+                break
+            self.migrate_chunk(model, chunk, using)
+            last_pk = chunk[-1].pk
+            cache.set(self.checkpoint_key, last_pk, timeout=None)
+        cache.delete(self.checkpoint_key)
+
+    def reverse(self, apps, schema_editor) -> None:
+        """Forget the progress. Usable as the reverse code of RunPython."""
+
+        self._get_cache().delete(self.checkpoint_key)
+
+    def _get_cache(self) -> BaseCache:
+        cache = caches[self.cache_alias]
+        if isinstance(cache, (LocMemCache, DummyCache)):
+            raise FreezeConfigurationError(
+                {
+                    'cache_alias': [
+                        f'{self.cache_alias!r} does not persist the '
+                        f'progress across processes.'
+                    ]
+                }
+            )
+        return cache
+
+    def migrate_chunk(self, model, chunk: list, using: str) -> None:
+        """Apply the updates to the chunk, and write them."""
+
+        with transaction.atomic(using=using):
+            updated_objs = []
+            updated_fields: set = set()
+            for obj in chunk:
+                updates = self.update(obj)
+                if not updates:
+                    continue
+                for field, value in updates.items():
+                    setattr(obj, field, value)
+                updated_fields.update(updates)
+                updated_objs.append(obj)
+            if updated_objs:
+                model._base_manager.using(using).bulk_update(
+                    updated_objs, sorted(updated_fields)
+                )
@@ -0,0 +1,118 @@
+import hashlib
+from typing import Any, Callable, Optional, Union
+
+from django.core.exceptions import ValidationError
+from django.db.models import QuerySet
+from django.http import HttpRequest
+from django.views.decorators.http import condition
+
+# A salt, or a callable returning it from the arguments of the view.
+EtagSalt = Union[str, Callable[..., str]]
+
+
+def _get_etag_lookups(model) -> list:
+    """
+    Columns which may still change while an instance of model is frozen:
+    its state and its NON_FROZEN_FIELDS.
+    """
+
+    lookups = [model._get_fsm_state_lookup()]
+    mutable = model._get_fsm_mutable_field_names()
+    for field in model._meta.concrete_fields:
+        if field.name in mutable and field.attname not in lookups:
+            lookups.append(field.attname)
+    return lookups
+
+
+def _digest(model, rows: list, salt: str) -> str:
+    content = repr(
+        (model._meta.label, model.get_fsm_frozen_field_names(), rows, salt)
+    )
+    return hashlib.sha1(content.encode()).hexdigest()
+
+
+def _get_salt(etag_salt: EtagSalt, request: HttpRequest, *args, **kwargs):
+    if callable(etag_salt):
+        return etag_salt(request, *args, **kwargs)
+    return etag_salt
+
+
+def fsm_frozen_queryset_etag(
+    queryset: QuerySet, salt: str = ''
+) -> Optional[str]:
+    """
+    Compute the ETag of the frozen instances of queryset (possibly sliced).
+
+    Only the primary keys, the states and the NON_FROZEN_FIELDS are selected,
+    in one query. There is no ETag (None) unless every instance is frozen.
+
+    The frozen fields are assumed to never change once frozen, e.g. an
+    instance does not leave its frozen states to be edited and frozen again.
+    Change salt when they do (e.g. under `bypass_fsm_freeze()`, or with
+    `FreezableBackfill`).
+    """
+
+    model = queryset.model
+    rows = list(
+        queryset.annotate(
+            _fsm_frozen=model.fsm_frozen_expression()
+        ).values_list('_fsm_frozen', 'pk', *_get_etag_lookups(model))
+    )
+    if not rows or not all(frozen for frozen, *_ in rows):
+        return None
+    # Sorted here: a sliced queryset cannot be reordered.
+    rows.sort(key=lambda row: row[1])
+    return _digest(model, [values for _, *values in rows], salt)
+
+
+def fsm_frozen_etag(model, pk: Any, salt: str = '') -> Optional[str]:
+    """
+    Compute the ETag of a frozen instance, or None if not frozen (or if pk
+    is malformed).
+    """
+
+    try:
+        queryset = model._default_manager.filter(pk=pk)
+    except (TypeError, ValueError, ValidationError):
+        return None
+    return fsm_frozen_queryset_etag(queryset, salt)
+
+
+def fsm_frozen_condition(
+    model, pk_url_kwarg: str = 'pk', etag_salt: EtagSalt = ''
+) -> Callable:
+    """
+    Decorate a detail view to answer `If-None-Match` with 304 while the
+    instance is frozen, without loading it.
+
+    etag_salt: folded into the ETag, or a callable returning it from the
+               arguments of the view
+    """
+
+    def etag_func(request: HttpRequest, *args, **kwargs) -> Optional[str]:
+        return fsm_frozen_etag(
+            model,
+            kwargs[pk_url_kwarg],
+            _get_salt(etag_salt, request, *args, **kwargs),
+        )
+
+    return condition(etag_func=etag_func)
+
+
+def fsm_frozen_list_condition(
+    get_queryset: Callable[..., QuerySet], etag_salt: EtagSalt = ''
+) -> Callable:
+    """
+    Decorate a list view to answer `If-None-Match` with 304 while all the
+    instances of `get_queryset(request, *args, **kwargs)` are frozen.
+
+    etag_salt: see `fsm_frozen_condition()`
+    """
+
+    def etag_func(request: HttpRequest, *args, **kwargs) -> Optional[str]:
+        return fsm_frozen_queryset_etag(
+            get_queryset(request, *args, **kwargs),
+            _get_salt(etag_salt, request, *args, **kwargs),
+        )
+
+    return condition(etag_func=etag_func)
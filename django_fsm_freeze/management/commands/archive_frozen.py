@@ -0,0 +1,37 @@
+from django.apps import apps
+from django.core.management.base import BaseCommand, CommandError
+
+from django_fsm_freeze.archive import archive_frozen
+from django_fsm_freeze.exceptions import FreezeConfigurationError
+
+
+class Command(BaseCommand):
+    help = (
+        'Move the rows in FROZEN_ARCHIVE_IN_STATES of the given models to '
+        'their FROZEN_ARCHIVE_MODEL.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('models', nargs='+', metavar='app_label.ModelName')
+        parser.add_argument('--batch-size', type=int, default=500)
+        parser.add_argument(
+            '--compress',
+            action='store_true',
+            help='Compress the archived rows.',
+        )
+
+    def handle(self, *args, **options):
+        for label in options['models']:
+            try:
+                model = apps.get_model(label)
+                archived, skipped = archive_frozen(
+                    model,
+                    batch_size=options['batch_size'],
+                    compress=options['compress'],
+                )
+            except (LookupError, ValueError, FreezeConfigurationError) as err:
+                raise CommandError(f'{label}: {err}')
+            self.stdout.write(
+                f'{model._meta.label}: archived {archived} row(s), '
+                f'skipped {skipped} row(s) still referenced.'
+            )
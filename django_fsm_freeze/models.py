@@ -1,21 +1,43 @@
-import threading
+import logging
 from collections import defaultdict
 from contextlib import contextmanager
-from typing import Any, Iterable, Optional, Union
+from contextvars import ContextVar
+from typing import Any, Iterable, Optional, Sequence, Union
 
 from dirtyfields import DirtyFieldsMixin
-from django.core.exceptions import FieldDoesNotExist
-from django.db import models
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import connections, models, router, transaction
+from django.db.models import BooleanField, Case, Q, Value, When
 from django.db.models.signals import class_prepared
 from django.dispatch import receiver
 from django_fsm import FSMField
 
+from django_fsm_freeze.audit import FreezeAuditAction, record_freeze_event
 from django_fsm_freeze.exceptions import (
     FreezeConfigurationError,
     FreezeValidationError,
 )
+from django_fsm_freeze.profiling import (
+    _ACTIVE_FSM_FREEZE_PROFILE,
+    _profile_fsm_operation,
+    _profile_fsm_phase,
+)
+from django_fsm_freeze.querysets import _READONLY_FSM_MODEL, FreezableQuerySet
+from django_fsm_freeze.signals import (
+    _index_frozen_dependent,
+    _record_frozen_state_change,
+)
 
-_DISABLED_FSM_FREEZE = threading.local()
+logger = logging.getLogger(__name__)
+
+# Context variables (rather than thread locals) isolate the bypassing and
+# locking scopes between threads, as well as between asyncio tasks.
+_DISABLED_FSM_FREEZE: ContextVar[bool] = ContextVar(
+    '_DISABLED_FSM_FREEZE', default=False
+)
+_DISABLED_FSM_FREEZE_MODELS: ContextVar[frozenset] = ContextVar(
+    '_DISABLED_FSM_FREEZE_MODELS', default=frozenset()
+)
 
 
 @contextmanager
@@ -24,12 +46,14 @@ def bypass_fsm_freeze(
         'FreezableFSMModelMixin', Iterable['FreezableFSMModelMixin']
     ] = (),
     bypass_globally: bool = False,
+    bypass_models: Iterable[type[models.Model]] = (),
 ):
     """
     Bypass the frozen checks.
 
     objs: the object(s) that will not be checked for its frozeness
     bypass_globally: flag to apply the bypassing globally
+    bypass_models: the model(s) whose objects will not be checked
     """
 
     if objs and not isinstance(objs, Iterable):
@@ -45,17 +69,84 @@ def bypass_fsm_freeze(
     if errors:
         raise FreezeConfigurationError(errors)
 
+    if bypass_globally is True:
+        record_freeze_event(FreezeAuditAction.BYPASS)
+    for model in bypass_models:
+        record_freeze_event(FreezeAuditAction.BYPASS, model)
+    for obj in objs:
+        record_freeze_event(FreezeAuditAction.BYPASS, obj)
+    labels = frozenset(model._meta.label for model in bypass_models)
+    global_token = (
+        _DISABLED_FSM_FREEZE.set(True) if bypass_globally is True else None
+    )
+    models_token = _DISABLED_FSM_FREEZE_MODELS.set(
+        _DISABLED_FSM_FREEZE_MODELS.get() | labels
+    )
+    # Instances may be shared between threads bypassing them: each scope
+    # adds (and removes) its own token, appending to and removing from a
+    # list being atomic.
+    token = object()
+    for obj in objs:
+        obj.__dict__.setdefault('_bypass_fsm_freeze', []).append(token)
     try:
-        if bypass_globally is True:
-            _DISABLED_FSM_FREEZE.active = True
-        for obj in objs:
-            obj._bypass_fsm_freeze = True
         yield
     finally:
-        if bypass_globally is True:
-            _DISABLED_FSM_FREEZE.active = False
+        _DISABLED_FSM_FREEZE_MODELS.reset(models_token)
+        if global_token is not None:
+            _DISABLED_FSM_FREEZE.reset(global_token)
         for obj in objs:
-            obj._bypass_fsm_freeze = False
+            obj._bypass_fsm_freeze.remove(token)
+
+
+class _FreezeLockScope:
+    """Row locks taken (and states read) within a `lock_fsm_freeze()`."""
+
+    def __init__(self, no_key: bool = False):
+        self.no_key = no_key
+        # (db alias, model label, pk) -> fsm state of the locked owner row
+        self.states: dict = {}
+        # (db alias, model label, pk) -> pk of the owner it delegates to
+        self.links: dict = {}
+
+
+_LOCKED_FSM_FREEZE: ContextVar[Optional[_FreezeLockScope]] = ContextVar(
+    '_LOCKED_FSM_FREEZE', default=None
+)
+
+
+@contextmanager
+def lock_fsm_freeze(using: Optional[str] = None, no_key: bool = False):
+    """
+    Resolve the frozen state from locked rows for the duration of a
+    transaction.
+
+    Within this context, `save()` and `delete()` read the state of the row
+    owning the FSMField with `SELECT ... FOR UPDATE`, found through
+    `FROZEN_DELEGATE_TO` in the same statement. The locked state is cached
+    until the context exits, so saving siblings delegating to the same row
+    does not query it again.
+
+    Nested contexts share the scope of the outermost one (the cached states
+    are kept by database), and must lock with the same `no_key`.
+
+    using: the database the transaction is opened on, which must be the one
+           the saved instances are written to (and their rows locked on)
+    no_key: lock with `FOR NO KEY UPDATE` where the backend supports it
+    """
+
+    scope = _LOCKED_FSM_FREEZE.get()
+    if scope is not None and scope.no_key != no_key:
+        raise FreezeConfigurationError(
+            {'no_key': ['Differs from the enclosing lock_fsm_freeze().']}
+        )
+    with transaction.atomic(using=using):
+        token = _LOCKED_FSM_FREEZE.set(
+            scope or _FreezeLockScope(no_key=no_key)
+        )
+        try:
+            yield
+        finally:
+            _LOCKED_FSM_FREEZE.reset(token)
 
 
 def resolve_dotted_path(instance: Any, path: str) -> Any:
@@ -67,6 +158,59 @@ def resolve_dotted_path(instance: Any, path: str) -> Any:
     return instance
 
 
+def _fetch_fsm_state(
+    model: type[models.Model],
+    pk: Any,
+    path: list,
+    fsm_field: FSMField,
+    using: str,
+) -> Any:
+    """
+    Select the FSMField value alone, following the foreign keys in path.
+    """
+
+    lookup = '__'.join([field.name for field in path] + [fsm_field.attname])
+    return (
+        model._base_manager.using(using)
+        .filter(pk=pk)
+        .values_list(lookup, flat=True)
+        .get()
+    )
+
+
+def _get_locked_fsm_state_queryset(
+    model: type[models.Model],
+    pk: Any,
+    joins: str,
+    owner: type[models.Model],
+    using: str,
+    no_key: bool,
+) -> models.QuerySet:
+    """
+    Select and lock the (pk, FSMField value) of the owner row, found from
+    the row of model with pk along joins.
+
+    The joins are in a subquery, so only the owner row is locked: neither
+    `select_for_update(of=...)` (only following `select_related()`) nor the
+    nullable side of an outer join could be.
+    """
+
+    features = connections[using].features
+    queryset = owner._base_manager.using(using)
+    if joins:
+        queryset = queryset.filter(
+            pk__in=model._base_manager.using(using)
+            .filter(pk=pk)
+            .values(f'{joins}__pk')
+        )
+    else:
+        queryset = queryset.filter(pk=pk)
+    return queryset.select_for_update(
+        of=('self',) if features.has_select_for_update_of else (),
+        no_key=no_key and features.has_select_for_no_key_update,
+    ).values_list('pk', owner._get_fsm_field().attname)
+
+
 class FreezableFSMModelMixin(DirtyFieldsMixin, models.Model):
     """
     Support for django-fsm data immutability.
@@ -77,6 +221,9 @@ class FreezableFSMModelMixin(DirtyFieldsMixin, models.Model):
                         foreignkey, dot-separated path).
                         Cannot be combined with `FROZEN_STATE_LOOKUP_FIELD`.
     NON_FROZEN_FIELDS: fields that are mutable
+    FROZEN_ARCHIVE_MODEL: the (AbstractFrozenArchive) model, as
+                          'app_label.ModelName', rows are archived into
+    FROZEN_ARCHIVE_IN_STATES: fsm states from which rows can be archived
     """
 
     class Meta:
@@ -86,26 +233,96 @@ class FreezableFSMModelMixin(DirtyFieldsMixin, models.Model):
     FROZEN_STATE_LOOKUP_FIELD: Optional[str]
     FROZEN_DELEGATE_TO: Optional[str] = None
     NON_FROZEN_FIELDS: tuple = ()
+    FROZEN_ARCHIVE_MODEL: Optional[str] = None
+    FROZEN_ARCHIVE_IN_STATES: tuple = ()
+
+    # Tokens of the `bypass_fsm_freeze()` (possibly from several threads)
+    # bypassing this instance.
+    _bypass_fsm_freeze: Sequence[object] = ()
+    _fsm_readonly: bool = False
+
+    objects = FreezableQuerySet.as_manager()
+
+    def __init__(self, *args, **kwargs):
+        if _READONLY_FSM_MODEL.get() is self.__class__:
+            # Streamed by `FreezableQuerySet.stream_readonly()`: skip the
+            # dirty fields snapshot.
+            super(DirtyFieldsMixin, self).__init__(*args, **kwargs)
+            self._fsm_readonly = True
+        elif _ACTIVE_FSM_FREEZE_PROFILE.get() is None:
+            super().__init__(*args, **kwargs)
+        else:
+            with _profile_fsm_operation(self, 'load'):
+                super().__init__(*args, **kwargs)
 
-    _bypass_fsm_freeze: bool = False
+    def _as_dict(self, *args, **kwargs) -> dict:
+        if _ACTIVE_FSM_FREEZE_PROFILE.get() is None:
+            return super()._as_dict(*args, **kwargs)
+        with _profile_fsm_phase(self, 'snapshot'):
+            return super()._as_dict(*args, **kwargs)
 
     @property
     def is_fsm_frozen(self) -> bool:
         """Determine whether self is frozen or not."""
 
-        instance, fsm_field = self._resolve_delegation()
-        return (
-            fsm_field.value_from_object(instance) in instance.FROZEN_IN_STATES
-        )
+        if self._fsm_readonly:
+            return self._fsm_frozen
+        return self._is_fsm_frozen(for_write=False)
 
-    def _resolve_delegation(self) -> tuple['FreezableFSMModelMixin', FSMField]:
+    def _is_fsm_frozen(self, for_write: bool) -> bool:
+        owner, state = self._resolve_fsm_state(for_write)
+        return state in owner.FROZEN_IN_STATES
+
+    def _resolve_fsm_state(
+        self, for_write: bool = False
+    ) -> tuple[type['FreezableFSMModelMixin'], Any]:
         """
-        Find the FreezableFSMModelMixin instance and its FSMState field
+        Find the FreezableFSMModelMixin class and the value of its FSMField.
+
+        The instances along the delegation path are used as long as they are
+        loaded. Otherwise:
+         - for_write: the state is selected alone (joining the rest of the
+           path) from the database self is saved to, for authoritative
+           checks before saving or deleting; the related instances loaded
+           from another database (e.g. a replica) are not used either
+         - otherwise, the related instances are loaded (and cached) as
+           usual, from the database the routers choose for reading (e.g. a
+           replica, for informational checks)
+        Deferred fields are never loaded: the state is selected alone.
         """
 
-        if self.FROZEN_DELEGATE_TO:
-            instance = resolve_dotted_path(self, self.FROZEN_DELEGATE_TO)
-            if not isinstance(instance, FreezableFSMModelMixin):
+        path = self._get_delegation_fields()
+        owner = path[-1].related_model if path else self.__class__
+        fsm_field = owner._get_fsm_field()
+        using = (
+            router.db_for_write(self.__class__, instance=self)
+            if for_write
+            else None
+        )
+        instance: Any = self
+        for index, field in enumerate(path):
+            remaining = path[index:]
+            if field.attname in instance.get_deferred_fields():
+                return owner, self._fetch_fsm_state(
+                    instance.__class__,
+                    instance.pk,
+                    remaining,
+                    fsm_field,
+                    using,
+                )
+            related = field.get_cached_value(instance, None)
+            if for_write and (related is None or related._state.db != using):
+                pk = getattr(instance, field.attname)
+                if pk is not None:
+                    return owner, self._fetch_fsm_state(
+                        field.related_model,
+                        pk,
+                        remaining[1:],
+                        fsm_field,
+                        using,
+                    )
+            instance = getattr(instance, field.name)
+            if instance is None:
                 raise FreezeConfigurationError(
                     {
                         'FROZEN_DELEGATE_TO': [
@@ -114,34 +331,309 @@ class FreezableFSMModelMixin(DirtyFieldsMixin, models.Model):
                         ]
                     }
                 )
-            return instance, instance.__class__._get_fsm_field()
-        return self, self.__class__._get_fsm_field()
+        if fsm_field.attname in instance.get_deferred_fields():
+            return owner, self._fetch_fsm_state(
+                instance.__class__, instance.pk, [], fsm_field, using
+            )
+        return owner, fsm_field.value_from_object(instance)
+
+    def _fetch_fsm_state(
+        self,
+        model: type[models.Model],
+        pk: Any,
+        path: list,
+        fsm_field: FSMField,
+        using: Optional[str],
+    ) -> Any:
+        """
+        Select the state from the `using` database (for writes), or from the
+        database the routers choose for reading model.
+        """
+
+        for_write = using is not None
+        if not for_write:
+            using = router.db_for_read(model, instance=self)
+        logger.debug(
+            'Resolving the frozen state of %r on database %r (%s).',
+            self,
+            using,
+            'write' if for_write else 'read',
+        )
+        return _fetch_fsm_state(model, pk, path, fsm_field, using)
+
+    @classmethod
+    def fsm_frozen_expression(cls) -> Case:
+        """Build the SQL expression evaluating whether a row is frozen."""
+
+        owner = cls._get_frozen_state_owner()
+        return Case(
+            When(
+                Q(
+                    **{
+                        f'{cls._get_fsm_state_lookup()}__in': (
+                            owner.FROZEN_IN_STATES
+                        )
+                    }
+                ),
+                then=Value(True),
+            ),
+            default=Value(False),
+            output_field=BooleanField(),
+        )
+
+    @classmethod
+    def _get_delegation_fields(cls) -> list:
+        """
+        Find the foreign keys followed by FROZEN_DELEGATE_TO, in order.
+        """
+
+        fields: list = []
+        model = cls
+        try:
+            for part in (cls.FROZEN_DELEGATE_TO or '').split('.'):
+                if not part:
+                    continue
+                field = model._meta.get_field(part)
+                if not (field.many_to_one or field.one_to_one):
+                    raise FieldDoesNotExist
+                fields.append(field)
+                model = field.related_model
+        except FieldDoesNotExist:
+            model = None
+        if not (
+            isinstance(model, type)
+            and issubclass(model, FreezableFSMModelMixin)
+        ):
+            raise FreezeConfigurationError(
+                {
+                    'FROZEN_DELEGATE_TO': [
+                        'Does not resolve to a FreezableFSMModelMixin model.'
+                    ]
+                }
+            )
+        return fields
+
+    @classmethod
+    def _get_fsm_state_lookup(cls) -> str:
+        """The ORM lookup of the FSMField deciding frozeness, from cls."""
+
+        path = cls._get_delegation_fields()
+        owner = path[-1].related_model if path else cls
+        return '__'.join(
+            [field.name for field in path] + [owner._get_fsm_field().attname]
+        )
+
+    @classmethod
+    def _get_frozen_state_owner(cls) -> type['FreezableFSMModelMixin']:
+        """Find the model class holding the FSMField deciding frozeness."""
+
+        fields = cls._get_delegation_fields()
+        return fields[-1].related_model if fields else cls
+
+    @classmethod
+    def _get_fsm_mutable_field_names(cls) -> frozenset:
+        """Names of the fields which can change while frozen."""
+
+        owner = cls._get_frozen_state_owner()
+        return frozenset(
+            owner.NON_FROZEN_FIELDS + (owner._get_fsm_field().name,)
+        )
+
+    @classmethod
+    def get_fsm_frozen_field_names(cls) -> list:
+        """Names of the (concrete) fields which cannot change while frozen."""
+
+        mutable = cls._get_fsm_mutable_field_names()
+        return [
+            field.name
+            for field in cls._meta.concrete_fields
+            if field.name not in mutable
+        ]
+
+    def _fetch_locked_fsm_state(self, scope: _FreezeLockScope) -> Any:
+        """
+        Read the state of the owner row with a row lock.
+
+        The statement starts from the first model on the delegation path
+        (known from the in-memory foreign key, unless it is deferred) and
+        follows the rest of it.
+        """
+
+        path = self._get_delegation_fields()
+        owner = path[-1].related_model if path else self.__class__
+        using = router.db_for_write(self.__class__, instance=self)
+        if path and path[0].attname not in self.get_deferred_fields():
+            start_model = path[0].related_model
+            start_pk = getattr(self, path[0].attname)
+            path = path[1:]
+        else:
+            start_model, start_pk = self.__class__, self.pk
+        if start_pk is None:
+            return None
+
+        joins = '__'.join(field.name for field in path)
+        owner_pk = (
+            scope.links.get((using, start_model._meta.label, start_pk))
+            if joins
+            else start_pk
+        )
+        owner_key = (using, owner._meta.label, owner_pk)
+        if owner_key in scope.states:
+            return scope.states[owner_key]
+
+        if not transaction.get_connection(using).in_atomic_block:
+            raise FreezeConfigurationError(
+                {
+                    'using': [
+                        f'No transaction is open on {using!r}, where the '
+                        f'rows are locked: pass it to lock_fsm_freeze().'
+                    ]
+                }
+            )
+        row = _get_locked_fsm_state_queryset(
+            start_model, start_pk, joins, owner, using, scope.no_key
+        ).first()
+        if row is None:
+            return None
+        owner_pk, state = row
+        if joins:
+            scope.links[(using, start_model._meta.label, start_pk)] = owner_pk
+        scope.states[(using, owner._meta.label, owner_pk)] = state
+        return state
+
+    def _is_fsm_frozen_for_write(self) -> bool:
+        """
+        Determine frozeness before writing, honouring `lock_fsm_freeze()`.
+
+        Under a lock, the persisted state of the owner row is authoritative.
+        A model owning its FSMField is also frozen by its in-memory state,
+        e.g. after a transition which is not saved yet.
+        """
+
+        scope = _LOCKED_FSM_FREEZE.get()
+        if scope is None:
+            return self._is_fsm_frozen(for_write=True)
+        owner = self._get_frozen_state_owner()
+        if self._fetch_locked_fsm_state(scope) in owner.FROZEN_IN_STATES:
+            return True
+        return not self.FROZEN_DELEGATE_TO and self._is_fsm_frozen(
+            for_write=True
+        )
 
     @property
     def _is_fsm_freeze_bypassed(self) -> bool:
         return bool(
-            getattr(_DISABLED_FSM_FREEZE, 'active', False)
-            or self._bypass_fsm_freeze
+            self._bypass_fsm_freeze or self._is_fsm_freeze_model_bypassed()
+        )
+
+    @classmethod
+    def _is_fsm_freeze_model_bypassed(cls) -> bool:
+        return (
+            _DISABLED_FSM_FREEZE.get()
+            or cls._meta.label in _DISABLED_FSM_FREEZE_MODELS.get()
         )
 
+    @classmethod
+    def check_edits(
+        cls, queryset_or_pks: Union[models.QuerySet, Iterable], edits: dict
+    ) -> dict:
+        """
+        Dry-run the frozen checks of editing many instances alike.
+
+        queryset_or_pks: the instances to edit
+        edits: the new field values, by field name
+
+        Return the names of the fields which would be rejected by `save()`,
+        by primary key. The frozeness and the current values of the edited
+        frozen fields are selected in one query, instances are not loaded.
+        """
+
+        errors = defaultdict(list)
+        values = {}
+        for name, value in edits.items():
+            try:
+                field = cls._meta.get_field(name)
+            except FieldDoesNotExist:
+                errors[name].append(f'{name!r} field does not exist.')
+                continue
+            if field.is_relation:
+                value = getattr(value, 'pk', value)
+            try:
+                values[field] = field.to_python(value)
+            except ValidationError as err:
+                errors[name].extend(err.messages)
+        if errors:
+            raise FreezeConfigurationError(errors)
+
+        queryset = (
+            queryset_or_pks
+            if isinstance(queryset_or_pks, models.QuerySet)
+            else cls._default_manager.filter(pk__in=list(queryset_or_pks))
+        )
+        if cls._is_fsm_freeze_model_bypassed():
+            return {pk: [] for pk in queryset.values_list('pk', flat=True)}
+
+        frozen_field_names = cls.get_fsm_frozen_field_names()
+        edited = [
+            (field, value)
+            for field, value in values.items()
+            if field.name in frozen_field_names
+        ]
+        rows = queryset.annotate(
+            _fsm_frozen=cls.fsm_frozen_expression()
+        ).values_list(
+            'pk', '_fsm_frozen', *(field.attname for field, _ in edited)
+        )
+        blocked = {}
+        for pk, frozen, *current_values in rows:
+            blocked[pk] = (
+                [
+                    field.name
+                    for (field, value), current in zip(edited, current_values)
+                    if value != current
+                ]
+                if frozen
+                else []
+            )
+        return blocked
+
     def freeze_check(self) -> None:
         """Check dirty fields and frozen status.
 
         Raise `FreezeValidationError` if it is dirty and frozen.
         """
 
-        if self._is_fsm_freeze_bypassed or not self.is_fsm_frozen:
+        if self._is_fsm_freeze_bypassed:
             return
+        with _profile_fsm_phase(self, 'delegation'):
+            frozen = self._is_fsm_frozen_for_write()
+        if not frozen:
+            return
+        with _profile_fsm_phase(self, 'dirty_diffing'):
+            dirty_frozen_field_names = self._get_dirty_frozen_field_names()
         errors = defaultdict(list)
-        instance, fsm_field = self._resolve_delegation()
-        dirty_fields = self.get_dirty_fields(check_relationship=True)
-        for field in set(dirty_fields) - set(
-            instance.NON_FROZEN_FIELDS + (fsm_field.name,)
-        ):
+        for field in dirty_frozen_field_names:
             errors[field].append('Cannot change frozen field.')
         if errors:
+            record_freeze_event(
+                FreezeAuditAction.SAVE_VIOLATION, self, errors.keys()
+            )
             raise FreezeValidationError(errors)
 
+    def _get_dirty_frozen_field_names(self) -> list:
+        """
+        Return the dirty fields which are not mutable. The foreign keys are
+        compared by their raw (`*_id`) values: related objects are not
+        fetched.
+        """
+
+        mutable = self._get_fsm_mutable_field_names()
+        return [
+            field
+            for field in self.get_dirty_fields(check_relationship=True)
+            if field not in mutable
+        ]
+
     @classmethod
     def _get_fsm_field(cls) -> FSMField:
         """Discover the FSMField.
@@ -189,6 +681,10 @@ class FreezableFSMModelMixin(DirtyFieldsMixin, models.Model):
                 )
             except TypeError as err:
                 errors['FROZEN_STATE_LOOKUP_FIELD'].append(str(err))
+            if set(cls.FROZEN_ARCHIVE_IN_STATES) - set(cls.FROZEN_IN_STATES):
+                errors['FROZEN_ARCHIVE_IN_STATES'].append(
+                    'Must be in FROZEN_IN_STATES.'
+                )
 
         for field in cls.NON_FROZEN_FIELDS:
             try:
@@ -201,21 +697,83 @@ class FreezableFSMModelMixin(DirtyFieldsMixin, models.Model):
     def save(self, *args, **kwargs) -> None:
         """Data freeze checking before saving the object."""
 
-        if not kwargs.get('force_insert', None):
-            # e.g. not object creation
-            self.freeze_check()
+        if self._fsm_readonly:
+            raise FreezeValidationError(
+                f'{self!r} is read-only, cannot be saved.'
+            )
+        with _profile_fsm_operation(self, 'save'):
+            if not kwargs.get('force_insert', None):
+                # e.g. not object creation
+                self.freeze_check()
+            was_frozen = self._get_frozen_state_change(
+                kwargs.get('update_fields')
+            )
 
-        return super().save(*args, **kwargs)
+            super().save(*args, **kwargs)
+        self._forget_locked_fsm_state()
+        if was_frozen is not None:
+            _record_frozen_state_change(self, was_frozen, using=self._state.db)
+
+    def _get_frozen_state_change(self, update_fields=None) -> Optional[bool]:
+        """
+        The previous frozeness of an owner of its frozen state whose saved
+        FSMField crosses FROZEN_IN_STATES, or None.
+        """
+
+        if self.FROZEN_DELEGATE_TO or self._state.adding:
+            return None
+        fsm_field = self._get_fsm_field()
+        if update_fields is not None and not {
+            fsm_field.name,
+            fsm_field.attname,
+        } & set(update_fields):
+            return None
+        if fsm_field.name not in self._original_state:
+            # Deferred when loaded.
+            return None
+        was_frozen = (
+            self._original_state[fsm_field.name] in self.FROZEN_IN_STATES
+        )
+        frozen = getattr(self, fsm_field.attname) in self.FROZEN_IN_STATES
+        return was_frozen if was_frozen != frozen else None
 
     def delete(self, *args, **kwargs):
-        if not self._is_fsm_freeze_bypassed and self.is_fsm_frozen:
+        if self._fsm_readonly:
             raise FreezeValidationError(
-                f'{self!r} is frozen, cannot be deleted.'
+                f'{self!r} is read-only, cannot be deleted.'
             )
-        return super().delete(*args, **kwargs)
+        with _profile_fsm_operation(self, 'delete'):
+            if not self._is_fsm_freeze_bypassed:
+                with _profile_fsm_phase(self, 'delegation'):
+                    frozen = self._is_fsm_frozen_for_write()
+                if frozen:
+                    record_freeze_event(
+                        FreezeAuditAction.DELETE_VIOLATION, self
+                    )
+                    raise FreezeValidationError(
+                        f'{self!r} is frozen, cannot be deleted.'
+                    )
+            self._forget_locked_fsm_state()
+            return super().delete(*args, **kwargs)
+
+    def _forget_locked_fsm_state(self) -> None:
+        """
+        Drop the state (or the delegation link) of self cached by
+        `lock_fsm_freeze()`, as it is written: it is read again, with the
+        lock, when needed.
+        """
+
+        scope = _LOCKED_FSM_FREEZE.get()
+        if scope is None:
+            return
+        key = (self._state.db, self._meta.label, self.pk)
+        scope.states.pop(key, None)
+        scope.links.pop(key, None)
 
 
 @receiver(class_prepared)
 def on_class_prepared(sender, **kwargs):
     if issubclass(sender, FreezableFSMModelMixin):
         sender.config_check()
+        if sender.FROZEN_DELEGATE_TO:
+            _index_frozen_dependent(sender)
@@ -0,0 +1,207 @@
+import sys
+import time
+from contextlib import ExitStack, contextmanager, nullcontext
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from django.db import connections
+
+_ACTIVE_FSM_FREEZE_PROFILE: ContextVar[Optional['FreezeProfile']] = ContextVar(
+    '_ACTIVE_FSM_FREEZE_PROFILE', default=None
+)
+# (operation, phase) being profiled
+_PROFILED_FSM_FREEZE_PHASE: ContextVar[Optional[tuple]] = ContextVar(
+    '_PROFILED_FSM_FREEZE_PHASE', default=None
+)
+
+
+class PhaseStats:
+    """Cumulated cost of a phase."""
+
+    __slots__ = ('calls', 'seconds', 'queries', 'allocations')
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.queries = 0
+        self.allocations = 0
+
+
+class FreezeProfile:
+    """
+    Costs of the frozen checks, by model, delegation path, operation and
+    phase.
+
+    Operations: 'load' (the instance initialization), 'save' and 'delete'.
+    Phases: 'total' (the whole save or delete), 'snapshot' (of the dirty
+    fields, when loaded and after saving), 'delegation' (resolving the frozen
+    state, following FROZEN_DELEGATE_TO) and 'dirty_diffing' (comparing the
+    frozen fields with the snapshot). The allocations are the net number of
+    memory blocks allocated by the interpreter.
+    """
+
+    def __init__(self):
+        # (model label, delegation path, operation, phase) -> PhaseStats
+        self.stats: dict = {}
+
+    def record(
+        self, key: tuple, seconds: float, queries: int, allocations: int
+    ) -> None:
+        stats = self.stats.get(key)
+        if stats is None:
+            stats = self.stats[key] = PhaseStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        stats.queries += queries
+        stats.allocations += allocations
+
+    def top(self, limit: Optional[int] = 20) -> list:
+        """The (key, stats) pairs, the most expensive first."""
+
+        return sorted(
+            self.stats.items(), key=lambda item: item[1].seconds, reverse=True
+        )[:limit]
+
+    def summary(self, limit: Optional[int] = 20) -> str:
+        """Render the top offenders as a table."""
+
+        header = (
+            'model',
+            'delegation path',
+            'operation',
+            'phase',
+            'calls',
+            'seconds',
+            'queries',
+            'allocations',
+        )
+        rows = [header] + [
+            (
+                *key,
+                str(stats.calls),
+                f'{stats.seconds:.6f}',
+                str(stats.queries),
+                str(stats.allocations),
+            )
+            for key, stats in self.top(limit)
+        ]
+        widths = [max(len(row[index]) for row in rows) for index in range(8)]
+        return '\n'.join(
+            '  '.join(
+                value.ljust(width) if index < 4 else value.rjust(width)
+                for index, (value, width) in enumerate(zip(row, widths))
+            ).rstrip()
+            for row in rows
+        )
+
+
+@contextmanager
+def profile_fsm_freeze(profile: Optional[FreezeProfile] = None):
+    """
+    Profile the frozen checks of the freezable models in this context (the
+    current thread or asyncio task), into profile or a new one.
+
+    ```
+    with profile_fsm_freeze() as profile:
+        ...
+    print(profile.summary())
+    ```
+    """
+
+    if profile is None:
+        profile = FreezeProfile()
+    token = _ACTIVE_FSM_FREEZE_PROFILE.set(profile)
+    try:
+        yield profile
+    finally:
+        _ACTIVE_FSM_FREEZE_PROFILE.reset(token)
+
+
+class _QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context) -> Any:
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+@contextmanager
+def _measure(profile: FreezeProfile, key: tuple):
+    counter = _QueryCounter()
+    with ExitStack() as stack:
+        for connection in connections.all():
+            stack.enter_context(connection.execute_wrapper(counter))
+        allocated_blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            profile.record(
+                key,
+                time.perf_counter() - start,
+                counter.count,
+                sys.getallocatedblocks() - allocated_blocks,
+            )
+
+
+def _get_profile_key(obj: Any, operation: str, phase: str) -> tuple:
+    return (
+        obj._meta.label,
+        obj.FROZEN_DELEGATE_TO or '',
+        operation,
+        phase,
+    )
+
+
+# Shared by the operations and phases which are not profiled.
+_NOT_PROFILED = nullcontext()
+
+
+def _profile_fsm_operation(obj: Any, operation: str):
+    """Scope the profiled phases of an operation on obj."""
+
+    profile = _ACTIVE_FSM_FREEZE_PROFILE.get()
+    if profile is None:
+        return _NOT_PROFILED
+    return _profiled_operation(profile, obj, operation)
+
+
+@contextmanager
+def _profiled_operation(profile: FreezeProfile, obj: Any, operation: str):
+    token = _PROFILED_FSM_FREEZE_PHASE.set((operation, None))
+    try:
+        if operation == 'load':
+            yield
+        else:
+            with _measure(profile, _get_profile_key(obj, operation, 'total')):
+                yield
+    finally:
+        _PROFILED_FSM_FREEZE_PHASE.reset(token)
+
+
+def _profile_fsm_phase(obj: Any, phase: str):
+    """
+    Profile a phase of the current operation. The phases nested in another
+    one are part of it.
+    """
+
+    profile = _ACTIVE_FSM_FREEZE_PROFILE.get()
+    if profile is None:
+        return _NOT_PROFILED
+    current = _PROFILED_FSM_FREEZE_PHASE.get()
+    if current is None or current[1] is not None:
+        return _NOT_PROFILED
+    return _profiled_phase(profile, obj, current[0], phase)
+
+
+@contextmanager
+def _profiled_phase(
+    profile: FreezeProfile, obj: Any, operation: str, phase: str
+):
+    token = _PROFILED_FSM_FREEZE_PHASE.set((operation, phase))
+    try:
+        with _measure(profile, _get_profile_key(obj, operation, phase)):
+            yield
+    finally:
+        _PROFILED_FSM_FREEZE_PHASE.reset(token)
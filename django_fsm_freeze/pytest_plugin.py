@@ -0,0 +1,51 @@
+"""
+pytest plugin reporting the costs of the frozen checks of a test run, e.g.
+`pytest -p django_fsm_freeze.pytest_plugin --fsm-freeze-profile`.
+"""
+
+import pytest
+
+from django_fsm_freeze.profiling import FreezeProfile, profile_fsm_freeze
+
+
+def pytest_addoption(parser) -> None:
+    group = parser.getgroup('fsm-freeze')
+    group.addoption(
+        '--fsm-freeze-profile',
+        action='store_true',
+        default=False,
+        help='Profile the frozen checks of the freezable models.',
+    )
+    group.addoption(
+        '--fsm-freeze-profile-limit',
+        type=int,
+        default=20,
+        help='Number of the most expensive phases reported.',
+    )
+
+
+def pytest_configure(config) -> None:
+    if config.getoption('fsm_freeze_profile'):
+        config.pluginmanager.register(
+            FreezeProfilePlugin(config.getoption('fsm_freeze_profile_limit')),
+            'fsm-freeze-profile',
+        )
+
+
+class FreezeProfilePlugin:
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.profile = FreezeProfile()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        with profile_fsm_freeze(self.profile):
+            yield
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        terminalreporter.write_sep('=', 'fsm freeze profile')
+        if not self.profile.stats:
+            terminalreporter.write_line('No frozen checks.')
+            return
+        for line in self.profile.summary(self.limit).splitlines():
+            terminalreporter.write_line(line)
@@ -0,0 +1,95 @@
+from contextvars import ContextVar
+from typing import Any, Iterator, Optional
+
+from django.db import models
+from django.db.models.query import ModelIterable
+
+# The model whose instances are built read-only (without the dirty fields
+# snapshot), see `FreezableQuerySet.stream_readonly()`.
+_READONLY_FSM_MODEL: ContextVar[Optional[type]] = ContextVar(
+    '_READONLY_FSM_MODEL', default=None
+)
+
+
+class FreezableQuerySet(models.QuerySet):
+    """QuerySet of FreezableFSMModelMixin models."""
+
+    def get(self, *args, **kwargs):
+        """
+        Read through the archive (see FROZEN_ARCHIVE_MODEL) on `get()` by
+        primary key alone, of instances without annotations, deferred fields
+        nor locking.
+        """
+
+        try:
+            return super().get(*args, **kwargs)
+        except self.model.DoesNotExist:
+            pk = self._get_archived_pk(args, kwargs)
+            if pk is None:
+                raise
+            from django_fsm_freeze.archive import get_archived
+
+            obj = get_archived(self.model, pk, using=self.db)
+            if obj is None:
+                raise
+            return obj
+
+    def _get_archived_pk(self, args: tuple, kwargs: dict) -> Any:
+        query = self.query
+        if (
+            not self.model.FROZEN_ARCHIVE_MODEL
+            or args
+            or len(kwargs) != 1
+            or query.where
+            or self._iterable_class is not ModelIterable
+            or query.annotations
+            or query.extra
+            or query.deferred_loading != (frozenset(), True)
+            or query.select_for_update
+        ):
+            return None
+        key, value = next(iter(kwargs.items()))
+        if key not in ('pk', self.model._meta.pk.name):
+            return None
+        return value
+
+    def annotate_fsm_frozen(self, name: str = 'fsm_frozen'):
+        """Annotate whether each row is frozen, evaluated in SQL."""
+
+        return self.annotate(**{name: self.model.fsm_frozen_expression()})
+
+    def filter_fsm_frozen(self, frozen: bool = True):
+        """Keep the rows whose frozeness is `frozen`, evaluated in SQL."""
+
+        return self.annotate_fsm_frozen('_fsm_frozen').filter(
+            _fsm_frozen=frozen
+        )
+
+    def stream_readonly(self, chunk_size: int = 2000) -> Iterator:
+        """
+        Iterate over read-only instances with bounded memory.
+
+        The instances are streamed from a server-side cursor (when supported)
+        without the dirty fields snapshot, and their frozeness is computed
+        in SQL. Saving or deleting them raises `FreezeValidationError`.
+        Their related instances are regular ones.
+        """
+
+        rows = iter(
+            self.annotate_fsm_frozen('_fsm_frozen').iterator(
+                chunk_size=chunk_size
+            )
+        )
+        while True:
+            # Only the instances of the model built while fetching the next
+            # row are read-only: not its related instances (select_related(),
+            # prefetch_related()), nor the instances the consumer loads in
+            # between.
+            token = _READONLY_FSM_MODEL.set(self.model)
+            try:
+                obj = next(rows)
+            except StopIteration:
+                return
+            finally:
+                _READONLY_FSM_MODEL.reset(token)
+            yield obj
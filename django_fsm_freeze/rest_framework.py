@@ -0,0 +1,102 @@
+"""
+Django REST framework support, requires `djangorestframework`.
+"""
+
+from typing import Any
+
+from rest_framework import serializers
+from rest_framework.settings import api_settings
+
+FROZEN_FIELD_ERROR = 'Cannot change frozen field.'
+
+
+def _get_frozen_field_errors(instance: Any, attrs: dict) -> dict:
+    """Errors of the frozen fields attrs would change on instance."""
+
+    errors = {}
+    frozen_field_names = instance.get_fsm_frozen_field_names()
+    for name, value in attrs.items():
+        if name not in frozen_field_names:
+            continue
+        field = instance._meta.get_field(name)
+        if field.is_relation:
+            value = getattr(value, 'pk', value)
+        if getattr(instance, field.attname) != value:
+            errors[name] = [FROZEN_FIELD_ERROR]
+    return errors
+
+
+class FreezableListSerializer(serializers.ListSerializer):
+    """
+    Validate the frozen fields of all the (updated) instances at once.
+
+    The frozeness of the instances changing frozen fields is resolved in one
+    query. The instances are paired with the items of the data by position.
+    """
+
+    def to_internal_value(self, data):
+        validated = super().to_internal_value(data)
+        if self.instance is None:
+            return validated
+
+        instances = list(self.instance)[: len(validated)]
+        changes = {
+            index: errors
+            for index, (instance, attrs) in enumerate(
+                zip(instances, validated)
+            )
+            if not instance._is_fsm_freeze_bypassed
+            and (errors := _get_frozen_field_errors(instance, attrs))
+        }
+        if not changes:
+            return validated
+
+        model = self.child.Meta.model
+        frozen_pks = set(
+            model._base_manager.filter(
+                pk__in=[instances[index].pk for index in changes]
+            )
+            .annotate(_fsm_frozen=model.fsm_frozen_expression())
+            .filter(_fsm_frozen=True)
+            .values_list('pk', flat=True)
+        )
+        errors = {
+            index: item_errors
+            for index, item_errors in changes.items()
+            if instances[index].pk in frozen_pks
+        }
+        if errors:
+            if not getattr(
+                api_settings, 'LIST_SERIALIZER_ERRORS_AS_DICT', False
+            ):
+                errors = [errors.get(index, {}) for index in range(len(data))]
+            raise serializers.ValidationError(errors)
+        return validated
+
+
+class FreezableSerializerMixin:
+    """
+    ModelSerializer mixin rejecting changes of frozen fields in `validate()`,
+    before saving (and `FreezeValidationError` being raised).
+
+    The frozeness is only resolved when frozen fields are changed. Set
+    `Meta.list_serializer_class` to `FreezableListSerializer` to validate
+    many instances at once.
+    """
+
+    def validate(self, attrs):
+        attrs = super().validate(attrs)
+        instance = self.instance
+        if instance is None or isinstance(
+            self.parent, FreezableListSerializer
+        ):
+            # Created, or validated at once by the list serializer.
+            return attrs
+        errors = _get_frozen_field_errors(instance, attrs)
+        if (
+            errors
+            and not instance._is_fsm_freeze_bypassed
+            and instance.is_fsm_frozen
+        ):
+            raise serializers.ValidationError(errors)
+        return attrs
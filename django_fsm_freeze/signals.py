@@ -0,0 +1,122 @@
+from collections import defaultdict
+from contextvars import ContextVar
+from typing import Any, Optional
+
+from django.db import transaction
+from django.db.models.fields.related import lazy_related_operation
+from django.dispatch import Signal
+
+# Sent on commit, once per model owning the frozen state and direction, when
+# saved instances entered (frozen=True) or left (frozen=False) FROZEN_IN_STATES
+# during the transaction. Arguments: sender (the owner model), pks (frozenset),
+# frozen, using and dependents (see `get_frozen_dependents()`).
+frozen_state_changed = Signal()
+
+# Reverse delegation index: owner model label -> [(model, lookup)].
+_FROZEN_DEPENDENTS: dict = defaultdict(list)
+
+# Database alias -> _FrozenStateChanges of the current transaction.
+_PENDING_FROZEN_STATE_CHANGES: ContextVar[Optional[dict]] = ContextVar(
+    '_PENDING_FROZEN_STATE_CHANGES', default=None
+)
+
+
+def get_frozen_dependents(model) -> tuple:
+    """
+    The models delegating their frozeness to model (see FROZEN_DELEGATE_TO),
+    directly or not, as (model, lookup) pairs: the lookup goes from the
+    dependent model to model, e.g. `dependent.objects.filter(**{lookup +
+    '__in': pks})`.
+    """
+
+    return tuple(_FROZEN_DEPENDENTS[model._meta.label])
+
+
+def _index_frozen_dependent(model) -> None:
+    """
+    Index model under the owner of its frozen state, once the models along
+    its FROZEN_DELEGATE_TO path are prepared.
+    """
+
+    names = model.FROZEN_DELEGATE_TO.split('.')
+
+    def follow(current, index: int) -> None:
+        field = current._meta.get_field(names[index])
+
+        def resolved(current, related_model) -> None:
+            if index + 1 < len(names):
+                follow(related_model, index + 1)
+            else:
+                _FROZEN_DEPENDENTS[related_model._meta.label].append(
+                    (model, '__'.join(names))
+                )
+
+        lazy_related_operation(resolved, current, field.remote_field.model)
+
+    follow(model, 0)
+
+
+class _FrozenStateChanges:
+    """
+    The frozen state changes of a transaction, sent by the first of their
+    on-commit callbacks.
+
+    Each change has its own callback: the changes whose callbacks are all
+    discarded, by rolling their savepoint back, are not sent (nor are the
+    changes not committed as recorded, as the committed states are read
+    again before sending).
+    """
+
+    def __init__(self, using: str):
+        self.using = using
+        # (model, pk) -> frozeness before the transaction
+        self.changes: dict = {}
+        self.sent = False
+
+    def add(self, model, pk: Any, was_frozen: bool) -> None:
+        # Coalesced: from the first known state.
+        self.changes.setdefault((model, pk), was_frozen)
+        transaction.on_commit(self.send, using=self.using)
+
+    def send(self) -> None:
+        if self.sent:
+            return
+        self.sent = True
+        was_frozen_by_model = defaultdict(dict)
+        for (model, pk), was_frozen in self.changes.items():
+            was_frozen_by_model[model][pk] = was_frozen
+        for model, was_frozen_by_pk in was_frozen_by_model.items():
+            pks = defaultdict(set)
+            for pk, state in (
+                model._base_manager.using(self.using)
+                .filter(pk__in=was_frozen_by_pk)
+                .values_list('pk', model._get_fsm_field().attname)
+            ):
+                frozen = state in model.FROZEN_IN_STATES
+                if frozen != was_frozen_by_pk[pk]:
+                    pks[frozen].add(pk)
+            for frozen, model_pks in pks.items():
+                frozen_state_changed.send_robust(
+                    sender=model,
+                    pks=frozenset(model_pks),
+                    frozen=frozen,
+                    using=self.using,
+                    dependents=get_frozen_dependents(model),
+                )
+
+
+def _record_frozen_state_change(
+    obj: Any, was_frozen: bool, using: str
+) -> None:
+    """Record a saved change of frozeness, to be sent on commit."""
+
+    pending = _PENDING_FROZEN_STATE_CHANGES.get()
+    if pending is None:
+        pending = {}
+        _PENDING_FROZEN_STATE_CHANGES.set(pending)
+    # Sent at once in autocommit mode. Left unsent when its transaction is
+    # rolled back: reusing it is harmless, its states being read again.
+    changes = pending.get(using)
+    if changes is None or changes.sent:
+        changes = pending[using] = _FrozenStateChanges(using)
+    changes.add(obj._meta.concrete_model, obj.pk, was_frozen)
@@ -0,0 +1,8 @@
+from django.contrib import admin
+
+from django_fsm_freeze.admin import FreezableModelAdmin
+from mytest.models import FakeModel, SubFakeModel, SubSubFakeModel
+
+admin.site.register(FakeModel, FreezableModelAdmin)
+admin.site.register(SubFakeModel, FreezableModelAdmin)
+admin.site.register(SubSubFakeModel, FreezableModelAdmin)
@@ -0,0 +1,20 @@
+import pytest
+
+from mytest.models import FakeModel
+
+
+@pytest.fixture
+def active_fake_obj():
+    fake_obj = FakeModel.objects.create()
+    fake_obj.activate()
+    fake_obj.save()
+    return fake_obj
+
+
+@pytest.fixture
+def fake_objs():
+    new_obj = FakeModel.objects.create()
+    active_obj = FakeModel.objects.create()
+    active_obj.activate()
+    active_obj.save()
+    return new_obj, active_obj
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mytest', '0005_auto_20210823_1255'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FreezeAuditEvent',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                (
+                    'created_at',
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                (
+                    'action',
+                    models.CharField(
+                        choices=[
+                            ('save_violation', 'Frozen fields changed'),
+                            ('delete_violation', 'Frozen object deleted'),
+                            ('bypass', 'Frozen checks bypassed'),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                ('model', models.CharField(blank=True, max_length=255)),
+                ('object_pk', models.CharField(blank=True, max_length=255)),
+                ('fields', models.JSONField(blank=True, default=list)),
+                ('actor', models.CharField(blank=True, max_length=255)),
+            ],
+            options={
+                'abstract': False,
+            },
+        ),
+    ]
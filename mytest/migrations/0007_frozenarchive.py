@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:49
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('mytest', '0006_freezeauditevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FrozenArchive',
+            fields=[
+                (
+                    'id',
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name='ID',
+                    ),
+                ),
+                ('model', models.CharField(max_length=255)),
+                ('object_pk', models.CharField(max_length=255)),
+                (
+                    'archived_at',
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ('compressed', models.BooleanField(default=False)),
+                ('payload', models.BinaryField()),
+            ],
+            options={
+                'abstract': False,
+                'constraints': [
+                    models.UniqueConstraint(
+                        fields=('model', 'object_pk'),
+                        name='mytest_frozenarchive_unique_object',
+                    )
+                ],
+            },
+        ),
+    ]
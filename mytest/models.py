@@ -3,6 +3,8 @@ from enum import Enum
 from django.db import models
 from django_fsm import FSMField, transition
 
+from django_fsm_freeze.archive import AbstractFrozenArchive
+from django_fsm_freeze.audit import AbstractFreezeAuditEvent
 from django_fsm_freeze.models import FreezableFSMModelMixin
 
 
@@ -76,6 +78,8 @@ class FakeModel2(FreezableFSMModelMixin):
     )
     FROZEN_STATE_LOOKUP_FIELD = 'status'
     NON_FROZEN_FIELDS = ('can_change_me',)
+    FROZEN_ARCHIVE_MODEL = 'mytest.FrozenArchive'
+    FROZEN_ARCHIVE_IN_STATES = (FakeStates.ARCHIVED.value,)
 
     status = FSMField(default=FakeStates.NEW.value)
     another_status = FSMField(default=FakeStates.NEW.value)
@@ -98,3 +102,11 @@ class FakeModel2(FreezableFSMModelMixin):
     )
     def archive(self, *args, **kwargs) -> None:
         pass
+
+
+class FreezeAuditEvent(AbstractFreezeAuditEvent):
+    pass
+
+
+class FrozenArchive(AbstractFrozenArchive):
+    pass
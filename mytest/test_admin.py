@@ -0,0 +1,81 @@
+import pytest
+from django.contrib.admin.sites import site
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from mytest.models import FakeModel, SubFakeModel, SubSubFakeModel
+
+
+def create_sub_subs(fake_objs, count):
+    for i in range(count):
+        SubSubFakeModel.objects.create(
+            sub_fake_model=SubFakeModel.objects.create(
+                fake_model=fake_objs[i % 2]
+            )
+        )
+
+
+@pytest.mark.django_db
+class TestFreezableModelAdmin:
+    def test_changelist_queries_do_not_grow_with_rows(
+        self, admin_client, fake_objs
+    ):
+        url = reverse('admin:mytest_subsubfakemodel_changelist')
+        create_sub_subs(fake_objs, 2)
+        with CaptureQueriesContext(connection) as few:
+            admin_client.get(url)
+        create_sub_subs(fake_objs, 8)
+
+        with CaptureQueriesContext(connection) as many:
+            response = admin_client.get(url)
+
+        assert response.status_code == 200
+        assert len(many) == len(few)
+
+    @pytest.mark.parametrize('frozen, count', [('1', 5), ('0', 5)])
+    def test_frozen_filter(self, admin_client, fake_objs, frozen, count):
+        create_sub_subs(fake_objs, 10)
+
+        response = admin_client.get(
+            reverse('admin:mytest_subsubfakemodel_changelist'),
+            {'fsm_frozen': frozen},
+        )
+
+        assert response.context['cl'].result_count == count
+        assert all(
+            obj._fsm_frozen is (frozen == '1')
+            for obj in response.context['cl'].result_list
+        )
+
+    def test_readonly_fields(self, rf, fake_objs):
+        new_obj, active_obj = fake_objs
+        model_admin = site._registry[SubFakeModel]
+        request = rf.get('/')
+
+        assert model_admin.get_readonly_fields(request) == ()
+        assert (
+            model_admin.get_readonly_fields(
+                request, SubFakeModel(fake_model=new_obj)
+            )
+            == ()
+        )
+        assert model_admin.get_readonly_fields(
+            request, SubFakeModel(fake_model=active_obj)
+        ) == ('fake_model', 'another_model', 'cannot_change_me')
+        assert site._registry[FakeModel].get_readonly_fields(
+            request, active_obj
+        ) == ('cannot_change_me',)
+
+    def test_change_form_of_frozen_instance(self, admin_client, fake_objs):
+        sub_fake = SubFakeModel.objects.create(fake_model=fake_objs[1])
+        url = reverse('admin:mytest_subfakemodel_change', args=(sub_fake.pk,))
+
+        response = admin_client.post(
+            url, {'can_change_me': 'on', 'cannot_change_me': 'on'}
+        )
+
+        assert response.status_code == 302
+        sub_fake.refresh_from_db()
+        assert sub_fake.can_change_me is True
+        assert sub_fake.cannot_change_me is False
@@ -0,0 +1,152 @@
+import pytest
+from django.core.management import CommandError, call_command
+
+from django_fsm_freeze import archive
+from django_fsm_freeze.archive import archive_frozen
+from django_fsm_freeze.exceptions import (
+    FreezeConfigurationError,
+    FreezeValidationError,
+)
+from mytest.models import (
+    FakeModel,
+    FakeModel2,
+    FakeStates,
+    FrozenArchive,
+    SubFakeModel,
+)
+
+
+@pytest.fixture
+def fake2_objs():
+    objs = [FakeModel2.objects.create(can_change_me=True) for _ in range(3)]
+    for obj in objs[:2]:
+        obj.activate()
+        obj.archive()
+        obj.save()
+    objs[2].activate()
+    objs[2].save()
+    return objs
+
+
+@pytest.mark.django_db
+class TestArchiveFrozen:
+    @pytest.mark.parametrize('compress', [False, True])
+    def test_archive_frozen(self, fake2_objs, compress):
+        assert archive_frozen(FakeModel2, compress=compress) == (2, 0)
+
+        assert list(FakeModel2.objects.values_list('pk', flat=True)) == [
+            fake2_objs[2].pk
+        ]
+        assert FrozenArchive.objects.count() == 2
+        archived = FakeModel2.objects.get(pk=fake2_objs[0].pk)
+        assert archived.status == FakeStates.ARCHIVED.value
+        assert archived.can_change_me is True
+        assert archived.is_fsm_frozen
+        with pytest.raises(FreezeValidationError):
+            archived.save()
+
+    def test_read_through_by_pk_only(self, fake2_objs):
+        archive_frozen(FakeModel2)
+
+        assert FakeModel2.objects.get(pk=str(fake2_objs[1].pk))
+        with pytest.raises(FakeModel2.DoesNotExist):
+            FakeModel2.objects.filter(can_change_me=True).get(
+                pk=fake2_objs[1].pk
+            )
+        with pytest.raises(FakeModel2.DoesNotExist):
+            FakeModel2.objects.get(pk=0)
+
+    @pytest.mark.parametrize(
+        'get_queryset',
+        [
+            lambda queryset: queryset.values('status'),
+            lambda queryset: queryset.values_list('pk', flat=True),
+            lambda queryset: queryset.annotate_fsm_frozen(),
+            lambda queryset: queryset.only('status'),
+            lambda queryset: queryset.select_for_update(),
+        ],
+    )
+    def test_no_read_through_of_other_shapes(self, fake2_objs, get_queryset):
+        archive_frozen(FakeModel2)
+
+        with pytest.raises(FakeModel2.DoesNotExist):
+            get_queryset(FakeModel2.objects).get(pk=fake2_objs[1].pk)
+
+    def test_referenced_rows_are_skipped(self, mocker):
+        mocker.patch.object(
+            FakeModel, 'FROZEN_ARCHIVE_MODEL', 'mytest.FrozenArchive'
+        )
+        mocker.patch.object(
+            FakeModel, 'FROZEN_ARCHIVE_IN_STATES', (FakeStates.ACTIVE.value,)
+        )
+        fake_objs = [FakeModel.objects.create() for _ in range(2)]
+        for obj in fake_objs:
+            obj.activate()
+            obj.save()
+        SubFakeModel.objects.create(fake_model=fake_objs[0])
+
+        assert archive_frozen(FakeModel) == (1, 1)
+
+        assert list(FakeModel.objects.all()) == [fake_objs[0]]
+
+    def test_rows_edited_since_read_are_moved_as_they_are_now(
+        self, fake2_objs, mocker
+    ):
+        move = archive._move
+
+        def edit_then_move(queryset, archive_model, pks, compress):
+            FakeModel2.objects.filter(pk=fake2_objs[0].pk).update(
+                status=FakeStates.ACTIVE.value
+            )
+            FakeModel2.objects.filter(pk=fake2_objs[1].pk).update(
+                can_change_me=False
+            )
+            return move(queryset, archive_model, pks, compress)
+
+        mocker.patch.object(archive, '_move', side_effect=edit_then_move)
+
+        assert archive_frozen(FakeModel2) == (1, 0)
+
+        assert set(FakeModel2.objects.values_list('pk', flat=True)) == {
+            fake2_objs[0].pk,
+            fake2_objs[2].pk,
+        }
+        assert FrozenArchive.objects.get().object_pk == str(fake2_objs[1].pk)
+        assert (
+            FakeModel2.objects.get(pk=fake2_objs[1].pk).can_change_me is False
+        )
+
+    def test_archive_is_append_only(self, fake2_objs):
+        archive_frozen(FakeModel2)
+        archive = FrozenArchive.objects.first()
+
+        with pytest.raises(FreezeValidationError):
+            archive.save()
+        with pytest.raises(FreezeValidationError):
+            archive.delete()
+
+    def test_not_configured(self):
+        with pytest.raises(FreezeConfigurationError):
+            archive_frozen(FakeModel)
+
+    def test_archive_in_states_must_be_frozen(self, mocker):
+        mocker.patch.object(FakeModel2, 'FROZEN_ARCHIVE_IN_STATES', ('new',))
+
+        with pytest.raises(FreezeConfigurationError) as err:
+            FakeModel2.config_check()
+
+        assert err.value.message_dict == {
+            'FROZEN_ARCHIVE_IN_STATES': ['Must be in FROZEN_IN_STATES.']
+        }
+
+    def test_command(self, fake2_objs, capsys):
+        call_command('archive_frozen', 'mytest.FakeModel2', '--compress')
+
+        assert capsys.readouterr().out == (
+            'mytest.FakeModel2: archived 2 row(s), '
+            'skipped 0 row(s) still referenced.\n'
+        )
+        assert FrozenArchive.objects.filter(compressed=True).count() == 2
+
+        with pytest.raises(CommandError):
+            call_command('archive_frozen', 'mytest.FakeModel')
@@ -0,0 +1,162 @@
+import pytest
+from django.db import transaction
+from django.test import override_settings
+
+from django_fsm_freeze.audit import (
+    FreezeAuditAction,
+    FreezeAuditor,
+    get_auditor,
+)
+from django_fsm_freeze.exceptions import (
+    FreezeConfigurationError,
+    FreezeValidationError,
+)
+from django_fsm_freeze.models import bypass_fsm_freeze
+from mytest.models import FreezeAuditEvent
+
+
+def get_actor():
+    return 'tester'
+
+
+@pytest.mark.django_db
+class TestFreezeAudit:
+    def test_no_audit_by_default(self, active_fake_obj):
+        with pytest.raises(FreezeValidationError):
+            active_fake_obj.delete()
+
+        assert FreezeAuditEvent.objects.count() == 0
+
+    def test_buffered_events_are_written_in_batches(
+        self, active_fake_obj, django_assert_num_queries
+    ):
+        auditor = FreezeAuditor(
+            FreezeAuditEvent, mode='on_commit', batch_size=2
+        )
+        for _ in range(3):
+            auditor.record(FreezeAuditAction.BYPASS, active_fake_obj)
+
+        with django_assert_num_queries(2):
+            assert auditor.flush() == 3
+        assert FreezeAuditEvent.objects.count() == 3
+
+    def test_dropped_events_are_counted(self, active_fake_obj):
+        auditor = FreezeAuditor(
+            FreezeAuditEvent, mode='on_commit', max_queue_size=2
+        )
+        for _ in range(3):
+            auditor.record(FreezeAuditAction.BYPASS, active_fake_obj)
+
+        assert auditor.dropped == 1
+        assert auditor.flush() == 2
+
+    @override_settings(
+        FSM_FREEZE_AUDIT={
+            'MODEL': 'mytest.FreezeAuditEvent',
+            'MODE': 'sync',
+            'ACTOR': 'mytest.test_audit.get_actor',
+        }
+    )
+    def test_sync_audit(self, active_fake_obj):
+        active_fake_obj.cannot_change_me = True
+        with pytest.raises(FreezeValidationError):
+            active_fake_obj.save()
+        with pytest.raises(FreezeValidationError):
+            active_fake_obj.delete()
+        with bypass_fsm_freeze(active_fake_obj):
+            pass
+        with bypass_fsm_freeze(bypass_globally=True):
+            pass
+
+        assert list(
+            FreezeAuditEvent.objects.order_by('pk').values_list(
+                'action', 'model', 'object_pk', 'fields', 'actor'
+            )
+        ) == [
+            (
+                FreezeAuditAction.SAVE_VIOLATION,
+                'mytest.FakeModel',
+                str(active_fake_obj.pk),
+                ['cannot_change_me'],
+                'tester',
+            ),
+            (
+                FreezeAuditAction.DELETE_VIOLATION,
+                'mytest.FakeModel',
+                str(active_fake_obj.pk),
+                [],
+                'tester',
+            ),
+            (
+                FreezeAuditAction.BYPASS,
+                'mytest.FakeModel',
+                str(active_fake_obj.pk),
+                [],
+                'tester',
+            ),
+            (FreezeAuditAction.BYPASS, '', '', [], 'tester'),
+        ]
+        assert get_auditor().dropped == 0
+
+    def test_invalid_configuration(self):
+        with pytest.raises(FreezeConfigurationError) as err:
+            FreezeAuditor(FreezeAuditEvent, mode='later', overflow='crash')
+
+        assert set(err.value.message_dict) == {'MODE', 'OVERFLOW'}
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFreezeAuditFlushing:
+    @override_settings(
+        FSM_FREEZE_AUDIT={
+            'MODEL': 'mytest.FreezeAuditEvent',
+            'MODE': 'on_commit',
+        }
+    )
+    def test_violations_outlive_the_rolled_back_transaction(
+        self, active_fake_obj
+    ):
+        auditor = get_auditor()
+        with pytest.raises(FreezeValidationError):
+            with transaction.atomic():
+                active_fake_obj.cannot_change_me = True
+                active_fake_obj.save()
+        # Written by the background thread, not on commit.
+        auditor.close()
+
+        assert auditor.dropped == 0
+        assert list(FreezeAuditEvent.objects.values_list('action')) == [
+            (FreezeAuditAction.SAVE_VIOLATION,)
+        ]
+
+    def test_queue_is_flushed_at_exit(self, active_fake_obj, mocker):
+        register = mocker.patch('atexit.register')
+        unregister = mocker.patch('atexit.unregister')
+        auditor = FreezeAuditor(FreezeAuditEvent, flush_interval=60)
+        auditor.record(FreezeAuditAction.BYPASS, active_fake_obj)
+
+        register.assert_called_once_with(auditor.close)
+        auditor.close()
+        unregister.assert_called_once_with(auditor.close)
+        assert FreezeAuditEvent.objects.count() == 1
+
+    def test_on_commit_flush(self, active_fake_obj):
+        auditor = FreezeAuditor(FreezeAuditEvent, mode='on_commit')
+        with transaction.atomic():
+            auditor.record(FreezeAuditAction.BYPASS, active_fake_obj)
+            auditor.record(FreezeAuditAction.BYPASS, active_fake_obj)
+            assert FreezeAuditEvent.objects.count() == 0
+
+        assert FreezeAuditEvent.objects.count() == 2
+
+    def test_background_flush(self, active_fake_obj):
+        auditor = FreezeAuditor(
+            FreezeAuditEvent, flush_interval=60, batch_size=2
+        )
+        auditor.record(FreezeAuditAction.BYPASS, active_fake_obj)
+        auditor.record(FreezeAuditAction.BYPASS, active_fake_obj)
+        auditor.record(FreezeAuditAction.BYPASS, active_fake_obj)
+        auditor.close()
+
+        assert FreezeAuditEvent.objects.count() == 3
+        assert auditor.dropped == 0
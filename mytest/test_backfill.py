@@ -0,0 +1,141 @@
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.db.migrations.executor import MigrationExecutor
+
+from django_fsm_freeze.backfill import FreezableBackfill
+from django_fsm_freeze.exceptions import (
+    FreezeConfigurationError,
+    FreezeValidationError,
+)
+from django_fsm_freeze.models import FreezableFSMModelMixin, bypass_fsm_freeze
+from mytest.models import FakeModel, FakeModel2
+
+
+def change_me(obj):
+    return {'cannot_change_me': True} if obj.pk % 2 else {}
+
+
+@pytest.fixture
+def active_fake_objs():
+    objs = [FakeModel.objects.create() for _ in range(5)]
+    for obj in objs:
+        obj.activate()
+        obj.save()
+    return objs
+
+
+@pytest.fixture(autouse=True)
+def file_cache(settings, tmp_path):
+    settings.CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': str(tmp_path),
+        }
+    }
+
+
+def run(backfill):
+    # As RunPython does: with the historical models of the migrations.
+    apps = MigrationExecutor(connection).loader.project_state().apps
+    with connection.schema_editor(atomic=False) as schema_editor:
+        backfill(apps, schema_editor)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestFreezableBackfill:
+    def test_historical_models_are_not_checked(self):
+        apps = MigrationExecutor(connection).loader.project_state().apps
+
+        assert not issubclass(
+            apps.get_model('mytest', 'FakeModel'), FreezableFSMModelMixin
+        )
+
+    def test_backfill(self, active_fake_objs):
+        backfill = FreezableBackfill(
+            'mytest', 'FakeModel', change_me, chunk_size=2
+        )
+
+        run(backfill)
+
+        assert sorted(
+            FakeModel.objects.filter(cannot_change_me=True).values_list(
+                'pk', flat=True
+            )
+        ) == [obj.pk for obj in active_fake_objs if obj.pk % 2]
+        assert cache.get(backfill.checkpoint_key) is None
+
+    def test_backfill_resumes(self, active_fake_objs):
+        calls = []
+
+        def interrupted(obj):
+            calls.append(obj.pk)
+            if len(calls) == 3:
+                raise KeyboardInterrupt
+            return {'cannot_change_me': True}
+
+        backfill = FreezableBackfill(
+            'mytest', 'FakeModel', interrupted, chunk_size=2
+        )
+        with pytest.raises(KeyboardInterrupt):
+            run(backfill)
+
+        # the first chunk is committed, the second is rolled back
+        assert FakeModel.objects.filter(cannot_change_me=True).count() == 2
+        assert cache.get(backfill.checkpoint_key) == active_fake_objs[1].pk
+
+        run(backfill)
+
+        assert FakeModel.objects.filter(cannot_change_me=True).count() == 5
+        assert calls == [obj.pk for obj in active_fake_objs[:3]] + [
+            obj.pk for obj in active_fake_objs[2:]
+        ]
+
+    def test_reverse_forgets_the_progress(self, active_fake_objs):
+        backfill = FreezableBackfill('mytest', 'FakeModel', change_me)
+        cache.set(backfill.checkpoint_key, active_fake_objs[-1].pk)
+
+        with connection.schema_editor(atomic=False) as schema_editor:
+            backfill.reverse(None, schema_editor)
+        run(backfill)
+
+        assert FakeModel.objects.filter(cannot_change_me=True).count() == 3
+
+    @pytest.mark.parametrize(
+        'backend', ['locmem.LocMemCache', 'dummy.DummyCache']
+    )
+    def test_non_persistent_cache(self, settings, backend):
+        settings.CACHES = {
+            'default': {'BACKEND': f'django.core.cache.backends.{backend}'}
+        }
+        backfill = FreezableBackfill('mytest', 'FakeModel', change_me)
+
+        with pytest.raises(FreezeConfigurationError) as err:
+            run(backfill)
+
+        assert err.value.message_dict == {
+            'cache_alias': [
+                "'default' does not persist the progress across processes."
+            ]
+        }
+
+
+@pytest.mark.django_db
+class TestBypassModels:
+    def test_bypass_models(self):
+        fake_obj = FakeModel.objects.create()
+        fake_obj.activate()
+        fake2_obj = FakeModel2.objects.create()
+        fake2_obj.activate()
+        fake_obj.cannot_change_me = True
+        fake2_obj.cannot_change_me = True
+
+        with bypass_fsm_freeze(bypass_models=(FakeModel,)):
+            fake_obj.save()  # no error raised
+            with pytest.raises(FreezeValidationError):
+                fake2_obj.save()
+
+        fake_obj.can_change_me = True
+        fake_obj.cannot_change_me = False
+        with pytest.raises(FreezeValidationError):
+            fake_obj.save()
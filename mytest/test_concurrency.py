@@ -0,0 +1,211 @@
+"""
+Stress the bypassing (and freezing) state from thread pools and event loops.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from asgiref.sync import sync_to_async
+from django.db import connection
+
+from django_fsm_freeze.exceptions import FreezeValidationError
+from django_fsm_freeze.models import _DISABLED_FSM_FREEZE, bypass_fsm_freeze
+from mytest.models import FakeModel, FakeStates
+
+WORKERS = 8
+
+
+def run_in_threads(func, workers=WORKERS):
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return [
+            future.result()
+            for future in [executor.submit(func, i) for i in range(workers)]
+        ]
+
+
+class TestBypassConcurrency:
+    def test_global_bypass_is_isolated_between_threads(self):
+        barrier = threading.Barrier(WORKERS)
+
+        def work(i):
+            obj = FakeModel()
+            if i % 2:
+                with bypass_fsm_freeze(bypass_globally=True):
+                    barrier.wait()
+                    bypassed = obj._is_fsm_freeze_bypassed
+                    barrier.wait()
+                return bypassed is True
+            barrier.wait()
+            bypassed = obj._is_fsm_freeze_bypassed
+            barrier.wait()
+            return bypassed is False
+
+        assert all(run_in_threads(work))
+        assert _DISABLED_FSM_FREEZE.get() is False
+
+    def test_global_bypass_is_isolated_between_tasks(self):
+        async def bypassing(entered, checked):
+            with bypass_fsm_freeze(bypass_globally=True):
+                entered.set()
+                await checked.wait()
+                return FakeModel()._is_fsm_freeze_bypassed
+
+        async def checking(entered, checked):
+            await entered.wait()
+            bypassed = FakeModel()._is_fsm_freeze_bypassed
+            checked.set()
+            return bypassed
+
+        async def main():
+            results = []
+            for _ in range(WORKERS):
+                entered, checked = asyncio.Event(), asyncio.Event()
+                results.append(
+                    await asyncio.gather(
+                        bypassing(entered, checked),
+                        checking(entered, checked),
+                    )
+                )
+            return results
+
+        assert asyncio.run(main()) == [[True, False]] * WORKERS
+        assert _DISABLED_FSM_FREEZE.get() is False
+
+    def test_nested_global_bypass(self):
+        obj = FakeModel()
+        with bypass_fsm_freeze(bypass_globally=True):
+            with bypass_fsm_freeze(bypass_globally=True):
+                pass
+            assert obj._is_fsm_freeze_bypassed
+        assert not obj._is_fsm_freeze_bypassed
+
+    def test_shared_instance_bypassed_from_threads(self):
+        obj = FakeModel()
+        barrier = threading.Barrier(WORKERS)
+
+        def work(i):
+            for _ in range(100):
+                with bypass_fsm_freeze(obj):
+                    bypassed = obj._is_fsm_freeze_bypassed
+                if not bypassed:
+                    return False
+            with bypass_fsm_freeze(obj):
+                barrier.wait()
+                return obj._is_fsm_freeze_bypassed
+
+        assert all(run_in_threads(work))
+        assert not obj._bypass_fsm_freeze
+        assert not obj._is_fsm_freeze_bypassed
+
+    def test_throughput(self, record_property):
+        iterations = 2000
+
+        def ops_per_second(workers):
+            objs = [
+                FakeModel(state=FakeStates.ACTIVE.value)
+                for _ in range(workers)
+            ]
+
+            def work(i):
+                obj = objs[i]
+                for _ in range(iterations):
+                    with bypass_fsm_freeze(obj):
+                        assert (
+                            obj.is_fsm_frozen and obj._is_fsm_freeze_bypassed
+                        )
+                return not obj._is_fsm_freeze_bypassed
+
+            start = time.perf_counter()
+            assert all(run_in_threads(work, workers))
+            return workers * iterations / (time.perf_counter() - start)
+
+        single = ops_per_second(1)
+        scaling = ops_per_second(WORKERS) / single
+
+        # Measured only (e.g. with --junitxml): wall clock ratios are not
+        # reliable on loaded machines. Bounded by the GIL, it should stay
+        # close to 1, rather than collapse under contention.
+        record_property('ops_per_second', single)
+        record_property('scaling', scaling)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestSaveDeleteConcurrency:
+    def test_save_and_delete_from_threads(self):
+        objs = [FakeModel.objects.create() for _ in range(WORKERS)]
+        for obj in objs:
+            obj.activate()
+            obj.save()
+        lock = threading.Lock()
+
+        def work(i):
+            # SQLite (shared cache) locks tables: the queries are serialized,
+            # the freeze checks and bypasses are not.
+            try:
+                with lock:
+                    obj = FakeModel.objects.get(pk=objs[i].pk)
+                obj.cannot_change_me = True
+                with pytest.raises(FreezeValidationError):
+                    obj.save()
+                with pytest.raises(FreezeValidationError):
+                    obj.delete()
+                with bypass_fsm_freeze(obj):
+                    with lock:
+                        obj.save()
+                if i % 2:
+                    with bypass_fsm_freeze(bypass_globally=True):
+                        with lock:
+                            obj.delete()
+                return not obj._is_fsm_freeze_bypassed
+            finally:
+                connection.close()
+
+        assert all(run_in_threads(work))
+        assert FakeModel.objects.count() == WORKERS // 2
+        assert all(
+            FakeModel.objects.values_list('cannot_change_me', flat=True)
+        )
+
+    def test_save_and_delete_from_tasks(self):
+        objs = [FakeModel.objects.create() for _ in range(WORKERS)]
+        for obj in objs:
+            obj.activate()
+            obj.save()
+
+        async def work(i):
+            # The queries run in the thread of sync_to_async(), within a copy
+            # of the bypassing scopes of each task.
+            obj = await sync_to_async(FakeModel.objects.get)(pk=objs[i].pk)
+            obj.cannot_change_me = True
+            with pytest.raises(FreezeValidationError):
+                await sync_to_async(obj.save)()
+            with pytest.raises(FreezeValidationError):
+                await sync_to_async(obj.delete)()
+            with bypass_fsm_freeze(obj):
+                await asyncio.sleep(0)
+                await sync_to_async(obj.save)()
+            if i % 2:
+                with bypass_fsm_freeze(bypass_globally=True):
+                    await asyncio.sleep(0)
+                    await sync_to_async(obj.delete)()
+            return not obj._is_fsm_freeze_bypassed
+
+        async def main(i):
+            # The connection of the context of the test cannot be used from
+            # the thread of sync_to_async(): open another one, shared by the
+            # tasks.
+            await sync_to_async(lambda: connection.ensure_connection())()
+            try:
+                return await asyncio.gather(*map(work, range(WORKERS)))
+            finally:
+                await sync_to_async(lambda: connection.close())()
+
+        [results] = run_in_threads(lambda i: asyncio.run(main(i)), 1)
+        assert all(results)
+        assert FakeModel.objects.count() == WORKERS // 2
+        assert all(
+            FakeModel.objects.values_list('cannot_change_me', flat=True)
+        )
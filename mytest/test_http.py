@@ -0,0 +1,138 @@
+import pytest
+from django.http import HttpResponse, HttpResponseNotFound
+from django.test import RequestFactory
+
+from django_fsm_freeze.http import (
+    fsm_frozen_condition,
+    fsm_frozen_etag,
+    fsm_frozen_list_condition,
+    fsm_frozen_queryset_etag,
+)
+from django_fsm_freeze.models import bypass_fsm_freeze
+from mytest.models import FakeModel, SubFakeModel
+
+rendered = []
+
+
+@fsm_frozen_condition(SubFakeModel)
+def detail_view(request, pk):
+    rendered.append(pk)
+    return HttpResponse(SubFakeModel.objects.get(pk=pk).can_change_me)
+
+
+@fsm_frozen_list_condition(lambda request: SubFakeModel.objects.all())
+def list_view(request):
+    rendered.append(None)
+    return HttpResponse(list(SubFakeModel.objects.values_list('pk')))
+
+
+@pytest.fixture(autouse=True)
+def clear_rendered():
+    rendered.clear()
+
+
+@pytest.mark.django_db
+class TestFrozenConditionalGet:
+    def test_not_modified(self, active_fake_obj, django_assert_num_queries):
+        sub_fake = SubFakeModel.objects.create(fake_model=active_fake_obj)
+        etag = detail_view(RequestFactory().get('/'), pk=sub_fake.pk)['ETag']
+
+        with django_assert_num_queries(1):
+            response = detail_view(
+                RequestFactory().get('/', HTTP_IF_NONE_MATCH=etag),
+                pk=sub_fake.pk,
+            )
+
+        assert response.status_code == 304
+        assert rendered == [sub_fake.pk]
+
+    def test_no_etag_when_not_frozen(self):
+        fake_obj = FakeModel.objects.create()
+        sub_fake = SubFakeModel.objects.create(fake_model=fake_obj)
+
+        response = detail_view(RequestFactory().get('/'), pk=sub_fake.pk)
+
+        assert not response.has_header('ETag')
+        assert fsm_frozen_etag(SubFakeModel, sub_fake.pk) is None
+
+    def test_etag_changes_with_non_frozen_fields(self, active_fake_obj):
+        sub_fake = SubFakeModel.objects.create(fake_model=active_fake_obj)
+        etag = fsm_frozen_etag(SubFakeModel, sub_fake.pk)
+
+        sub_fake.can_change_me = True
+        sub_fake.save()
+
+        assert fsm_frozen_etag(SubFakeModel, sub_fake.pk) != etag
+
+    def test_etag_changes_with_state(self, active_fake_obj):
+        etag = fsm_frozen_etag(FakeModel, active_fake_obj.pk)
+
+        active_fake_obj.archive()
+        active_fake_obj.save()
+
+        assert fsm_frozen_etag(FakeModel, active_fake_obj.pk) != etag
+
+    def test_list_not_modified(self, active_fake_obj):
+        SubFakeModel.objects.create(fake_model=active_fake_obj)
+        SubFakeModel.objects.create(fake_model=active_fake_obj)
+        etag = list_view(RequestFactory().get('/'))['ETag']
+
+        response = list_view(
+            RequestFactory().get('/', HTTP_IF_NONE_MATCH=etag)
+        )
+
+        assert response.status_code == 304
+        assert rendered == [None]
+
+        new_fake = FakeModel.objects.create()
+        SubFakeModel.objects.create(fake_model=new_fake)
+        response = list_view(
+            RequestFactory().get('/', HTTP_IF_NONE_MATCH=etag)
+        )
+
+        assert response.status_code == 200
+        assert not response.has_header('ETag')
+
+    def test_sliced_queryset(self, active_fake_obj):
+        sub_fakes = [
+            SubFakeModel.objects.create(fake_model=active_fake_obj)
+            for _ in range(3)
+        ]
+
+        etag = fsm_frozen_queryset_etag(
+            SubFakeModel.objects.order_by('pk')[:2]
+        )
+
+        assert etag == fsm_frozen_queryset_etag(
+            SubFakeModel.objects.filter(
+                pk__in=[sub_fake.pk for sub_fake in sub_fakes[:2]]
+            ).order_by('-pk')
+        )
+
+    def test_etag_salt(self, active_fake_obj):
+        sub_fake = SubFakeModel.objects.create(fake_model=active_fake_obj)
+        etag = fsm_frozen_etag(SubFakeModel, sub_fake.pk)
+
+        with bypass_fsm_freeze(sub_fake):
+            sub_fake.cannot_change_me = True
+            sub_fake.save()
+
+        assert fsm_frozen_etag(SubFakeModel, sub_fake.pk) == etag
+        assert fsm_frozen_etag(SubFakeModel, sub_fake.pk, salt='v2') != etag
+        salted_view = fsm_frozen_condition(
+            SubFakeModel, etag_salt=lambda request, pk: 'v2'
+        )(detail_view)
+        response = salted_view(
+            RequestFactory().get('/', HTTP_IF_NONE_MATCH=etag), pk=sub_fake.pk
+        )
+        assert response.status_code == 200
+
+    def test_no_etag_for_malformed_pk(self):
+        @fsm_frozen_condition(SubFakeModel)
+        def not_found_view(request, pk):
+            return HttpResponseNotFound()
+
+        response = not_found_view(RequestFactory().get('/'), pk='malformed')
+
+        assert response.status_code == 404
+        assert fsm_frozen_etag(SubFakeModel, 'malformed') is None
@@ -1,19 +1,23 @@
 import pytest
+from django.db import connection, transaction
 
 from django_fsm_freeze.exceptions import (
     FreezeConfigurationError,
     FreezeValidationError,
 )
-from django_fsm_freeze.models import bypass_fsm_freeze
-from mytest.models import FakeModel, FakeModel2, SubFakeModel, SubSubFakeModel
-
-
-@pytest.fixture
-def active_fake_obj():
-    fake_obj = FakeModel.objects.create()
-    fake_obj.activate()
-    fake_obj.save()
-    return fake_obj
+from django_fsm_freeze.models import (
+    _get_locked_fsm_state_queryset,
+    bypass_fsm_freeze,
+    lock_fsm_freeze,
+)
+from mytest.models import (
+    FakeModel,
+    FakeModel2,
+    FakeStates,
+    NonFSMModel,
+    SubFakeModel,
+    SubSubFakeModel,
+)
 
 
 @pytest.fixture
@@ -320,3 +324,424 @@ class TestDelegationFreezeCheck:
             ]
         finally:
             SubFakeModel.FROZEN_DELEGATE_TO = previous_value
+
+
+@pytest.mark.django_db(transaction=True)
+class TestLockFreezeCheck:
+    def test_locked_state_is_read_from_the_database(self):
+        fake_obj = FakeModel.objects.create()
+        sub_fake = SubFakeModel.objects.create(fake_model=fake_obj)
+        assert sub_fake.fake_model.state == FakeStates.NEW.value
+
+        # a concurrent writer freezes the parent after it has been loaded
+        FakeModel.objects.filter(pk=fake_obj.pk).update(
+            state=FakeStates.ACTIVE.value
+        )
+        sub_fake.cannot_change_me = True
+        sub_fake.save()  # the stale in-memory parent is not frozen
+
+        sub_fake.cannot_change_me = False
+        with pytest.raises(FreezeValidationError):
+            with lock_fsm_freeze():
+                sub_fake.save()
+
+        sub_fake.refresh_from_db()
+        assert sub_fake.cannot_change_me is True
+
+    def test_locked_state_is_cached_within_the_transaction(
+        self, active_fake_obj, django_assert_num_queries
+    ):
+        sub_fake = SubFakeModel.objects.create(fake_model=active_fake_obj)
+        sub_subs = [
+            SubSubFakeModel.objects.create(sub_fake_model=sub_fake)
+            for _ in range(3)
+        ]
+        for sub_sub in sub_subs:
+            sub_sub.can_change_me = True
+
+        with lock_fsm_freeze():
+            # one locking SELECT, then one UPDATE per sibling
+            with django_assert_num_queries(4):
+                for sub_sub in sub_subs:
+                    sub_sub.save()
+
+    def test_locked_state_is_read_again_once_saved(self):
+        fake_obj = FakeModel.objects.create()
+        sub_fake = SubFakeModel.objects.create(fake_model=fake_obj)
+
+        with pytest.raises(FreezeValidationError):
+            with lock_fsm_freeze():
+                sub_fake.save()  # caches the 'new' parent state
+                fake_obj.activate()
+                fake_obj.save()
+                sub_fake.cannot_change_me = True
+                sub_fake.save()
+
+    def test_nested_locks_with_other_no_key(self):
+        with lock_fsm_freeze():
+            with pytest.raises(FreezeConfigurationError) as err:
+                with lock_fsm_freeze(no_key=True):
+                    pass
+
+        assert err.value.message_dict == {
+            'no_key': ['Differs from the enclosing lock_fsm_freeze().']
+        }
+
+    def test_frozen_in_memory_state_is_kept_under_lock(self):
+        fake_obj = FakeModel.objects.create()
+        fake_obj.activate()
+        fake_obj.cannot_change_me = True
+
+        with pytest.raises(FreezeValidationError):
+            with lock_fsm_freeze():
+                fake_obj.save()
+
+    def test_locked_delete(self, active_fake_obj):
+        sub_fake = SubFakeModel.objects.create(fake_model=active_fake_obj)
+
+        with pytest.raises(FreezeValidationError):
+            with lock_fsm_freeze():
+                sub_fake.delete()
+
+        with lock_fsm_freeze():
+            with bypass_fsm_freeze(sub_fake):
+                sub_fake.delete()  # no error raised
+
+    @pytest.mark.django_db(transaction=True, databases=['default', 'replica'])
+    def test_locks_out_of_the_transaction(self, active_fake_obj):
+        sub_fake = SubFakeModel.objects.create(fake_model=active_fake_obj)
+
+        with pytest.raises(FreezeConfigurationError) as err:
+            with lock_fsm_freeze(using='replica'):
+                sub_fake.save()
+
+        assert err.value.message_dict == {
+            'using': [
+                "No transaction is open on 'default', where the rows are "
+                'locked: pass it to lock_fsm_freeze().'
+            ]
+        }
+
+    @pytest.mark.parametrize(
+        'no_key, lock', [(False, 'FOR UPDATE'), (True, 'FOR NO KEY UPDATE')]
+    )
+    def test_locking_sql(self, mocker, no_key, lock):
+        # SQLite does not lock rows: compile as a backend which does.
+        mocker.patch.multiple(
+            connection.features,
+            has_select_for_update=True,
+            has_select_for_update_of=True,
+            has_select_for_no_key_update=True,
+        )
+        mocker.patch.object(
+            SubSubFakeModel._meta.get_field('sub_fake_model'), 'null', True
+        )
+        mocker.patch.object(
+            SubFakeModel._meta.get_field('fake_model'), 'null', True
+        )
+        queryset = _get_locked_fsm_state_queryset(
+            SubSubFakeModel,
+            1,
+            'sub_fake_model__fake_model',
+            FakeModel,
+            'default',
+            no_key,
+        )
+
+        with transaction.atomic():
+            sql, _ = queryset.query.get_compiler('default').as_sql()
+
+        # The nullable joins are in the subquery, only the owner is locked.
+        assert sql.startswith(
+            'SELECT "mytest_fakemodel"."id" AS "pk", '
+            '"mytest_fakemodel"."state" AS "state" '
+            'FROM "mytest_fakemodel" WHERE "mytest_fakemodel"."id" IN '
+            '(SELECT U1."fake_model_id" AS "sub_fake_model__fake_model__pk" '
+            'FROM "mytest_subsubfakemodel" U0 LEFT OUTER JOIN'
+        )
+        assert sql.endswith(f'{lock} OF "mytest_fakemodel"')
+
+
+@pytest.mark.django_db
+class TestDeferredFieldsFreezeCheck:
+    @pytest.mark.parametrize(
+        'mymodel', [FakeModel, SubFakeModel, SubSubFakeModel]
+    )
+    def test_only_loaded_fields_edit_and_save(
+        self, mymodel, active_fake_obj, django_assert_num_queries
+    ):
+        sub_fake = SubFakeModel.objects.create(fake_model=active_fake_obj)
+        SubSubFakeModel.objects.create(sub_fake_model=sub_fake)
+
+        # load, select the state alone, update
+        with django_assert_num_queries(3):
+            obj = mymodel.objects.only('pk', 'can_change_me').get()
+            obj.can_change_me = True
+            obj.save()
+
+        assert obj.get_deferred_fields() >= {'cannot_change_me'}
+        obj.refresh_from_db()
+        assert obj.can_change_me is True
+
+    def test_deferred_state_is_not_loaded(
+        self, active_fake_obj, django_assert_num_queries
+    ):
+        obj = FakeModel.objects.only('pk', 'cannot_change_me').get()
+        obj.cannot_change_me = True
+
+        with django_assert_num_queries(1):
+            with pytest.raises(FreezeValidationError):
+                obj.save()
+
+        assert 'state' in obj.get_deferred_fields()
+
+
+class RecordingRouter:
+    calls: list = []
+
+    def db_for_read(self, model, **hints):
+        self.calls.append(('read', model))
+        return 'default'
+
+    def db_for_write(self, model, **hints):
+        self.calls.append(('write', model))
+        return 'default'
+
+
+@pytest.mark.django_db
+class TestRoutedFreezeCheck:
+    @pytest.fixture(autouse=True)
+    def router(self, settings):
+        settings.DATABASE_ROUTERS = [f'{__name__}.RecordingRouter']
+        RecordingRouter.calls.clear()
+
+    def test_informational_check_is_routed_for_reading(
+        self, active_fake_obj, caplog
+    ):
+        sub_fake = SubFakeModel.objects.get(
+            pk=SubFakeModel.objects.create(fake_model=active_fake_obj).pk
+        )
+        RecordingRouter.calls.clear()
+
+        assert sub_fake.is_fsm_frozen
+
+        assert RecordingRouter.calls == [('read', FakeModel)]
+        assert SubFakeModel.fake_model.is_cached(sub_fake)
+
+    def test_informational_check_of_deferred_foreign_key(
+        self, active_fake_obj, caplog
+    ):
+        sub_fake = SubFakeModel.objects.only('pk').get(
+            pk=SubFakeModel.objects.create(fake_model=active_fake_obj).pk
+        )
+        RecordingRouter.calls.clear()
+
+        with caplog.at_level('DEBUG', logger='django_fsm_freeze'):
+            assert sub_fake.is_fsm_frozen
+
+        assert RecordingRouter.calls == [('read', SubFakeModel)]
+        assert caplog.messages == [
+            f'Resolving the frozen state of {sub_fake!r} on database'
+            f" 'default' (read)."
+        ]
+
+    def test_informational_checks_load_the_delegate_once(
+        self, active_fake_obj, django_assert_num_queries
+    ):
+        sub_fake = SubFakeModel.objects.get(
+            pk=SubFakeModel.objects.create(fake_model=active_fake_obj).pk
+        )
+
+        with django_assert_num_queries(1):
+            for _ in range(5):
+                assert sub_fake.is_fsm_frozen
+
+    def test_write_check_is_routed_for_writing(self, active_fake_obj, caplog):
+        sub_fake = SubFakeModel.objects.get(
+            pk=SubFakeModel.objects.create(fake_model=active_fake_obj).pk
+        )
+        sub_fake.cannot_change_me = True
+        RecordingRouter.calls.clear()
+
+        with caplog.at_level('DEBUG', logger='django_fsm_freeze'):
+            with pytest.raises(FreezeValidationError):
+                sub_fake.save()
+
+        assert RecordingRouter.calls == [('write', SubFakeModel)]
+        assert caplog.messages == [
+            f'Resolving the frozen state of {sub_fake!r} on database'
+            f" 'default' (write)."
+        ]
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        return 'replica'
+
+    def db_for_write(self, model, **hints):
+        return 'default'
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+
+@pytest.mark.django_db(databases=['default', 'replica'])
+class TestReplicaFreezeCheck:
+    @pytest.fixture(autouse=True)
+    def router(self, settings):
+        settings.DATABASE_ROUTERS = [f'{__name__}.ReplicaRouter']
+
+    @pytest.fixture
+    def sub_fake(self):
+        for using in ('default', 'replica'):
+            fake_obj = FakeModel.objects.using(using).create(pk=1)
+            SubFakeModel.objects.using(using).create(pk=1, fake_model=fake_obj)
+        # the replica lags behind: the parent is still new there
+        FakeModel.objects.using('default').update(
+            state=FakeStates.ACTIVE.value
+        )
+        sub_fake = SubFakeModel.objects.get(pk=1)
+        assert sub_fake._state.db == 'replica'
+        return sub_fake
+
+    def test_write_check_reads_the_primary(self, sub_fake):
+        assert not sub_fake.is_fsm_frozen  # informational, from the replica
+        sub_fake.cannot_change_me = True
+
+        with pytest.raises(FreezeValidationError):
+            sub_fake.save()
+
+    def test_related_instances_of_the_replica_are_not_used_for_writes(
+        self, sub_fake
+    ):
+        assert sub_fake.fake_model.state == FakeStates.NEW.value
+        sub_fake.cannot_change_me = True
+
+        with pytest.raises(FreezeValidationError):
+            sub_fake.save()
+
+    def test_locked_state_is_read_from_the_primary(self, sub_fake):
+        sub_fake.cannot_change_me = True
+
+        with pytest.raises(FreezeValidationError):
+            with lock_fsm_freeze():
+                sub_fake.save()
+
+
+@pytest.mark.django_db
+class TestRelationshipFreezeCheck:
+    @pytest.fixture
+    def sub_fake(self, active_fake_obj):
+        sub_fake = SubFakeModel.objects.create(
+            fake_model=active_fake_obj,
+            another_model=NonFSMModel.objects.create(),
+        )
+        return SubFakeModel.objects.get(pk=sub_fake.pk)
+
+    def test_changed_foreign_keys_are_frozen(self, sub_fake):
+        another_fake_obj = FakeModel.objects.create()
+        another_fake_obj.activate()
+        another_fake_obj.save()
+        sub_fake.fake_model = another_fake_obj
+        sub_fake.another_model_id = None
+
+        with pytest.raises(FreezeValidationError) as err:
+            sub_fake.save()
+
+        assert set(err.value.message_dict) == {'fake_model', 'another_model'}
+
+    def test_related_objects_are_not_fetched_on_save(
+        self, sub_fake, django_assert_num_queries
+    ):
+        sub_fake.can_change_me = True
+
+        # select the delegated state alone, update
+        with django_assert_num_queries(2):
+            sub_fake.save()
+
+        assert not SubFakeModel.fake_model.field.is_cached(sub_fake)
+        assert not SubFakeModel.another_model.field.is_cached(sub_fake)
+
+    def test_dirty_frozen_fields_without_queries(
+        self, sub_fake, django_assert_num_queries
+    ):
+        sub_fake.cannot_change_me = True
+        sub_fake.can_change_me = True
+
+        with django_assert_num_queries(0):
+            dirty_fields = sub_fake._get_dirty_frozen_field_names()
+
+        assert dirty_fields == ['cannot_change_me']
+        assert not SubFakeModel.fake_model.field.is_cached(sub_fake)
+        assert not SubFakeModel.another_model.field.is_cached(sub_fake)
+
+
+@pytest.mark.django_db
+class TestCheckEdits:
+    def test_frozen_fields_changed_on_frozen_instances_are_blocked(
+        self, active_fake_obj, django_assert_num_queries
+    ):
+        new_obj = FakeModel.objects.create()
+        edits = {'cannot_change_me': True, 'can_change_me': True}
+
+        with django_assert_num_queries(1):
+            blocked = FakeModel.check_edits(
+                [active_fake_obj.pk, new_obj.pk], edits
+            )
+
+        assert blocked == {
+            active_fake_obj.pk: ['cannot_change_me'],
+            new_obj.pk: [],
+        }
+
+    def test_unchanged_values_are_not_blocked(self, active_fake_obj):
+        blocked = FakeModel.check_edits(
+            FakeModel.objects.filter(pk=active_fake_obj.pk),
+            {'cannot_change_me': False},
+        )
+
+        assert blocked == {active_fake_obj.pk: []}
+
+    def test_delegated_foreign_keys(self, active_fake_obj):
+        sub_fake = SubFakeModel.objects.create(
+            fake_model=active_fake_obj,
+            another_model=NonFSMModel.objects.create(),
+        )
+        edits = {
+            'fake_model': active_fake_obj,
+            'another_model': NonFSMModel.objects.create(),
+        }
+
+        blocked = SubFakeModel.check_edits([sub_fake.pk], edits)
+
+        assert blocked == {sub_fake.pk: ['another_model']}
+
+    def test_bypassed_models_are_not_blocked(self, active_fake_obj):
+        with bypass_fsm_freeze(bypass_models=(FakeModel,)):
+            blocked = FakeModel.check_edits(
+                [active_fake_obj.pk], {'cannot_change_me': True}
+            )
+
+        assert blocked == {active_fake_obj.pk: []}
+
+    def test_unknown_fields_raise(self, active_fake_obj):
+        with pytest.raises(FreezeConfigurationError) as err:
+            FakeModel.check_edits([active_fake_obj.pk], {'unknown': True})
+
+        assert err.value.message_dict == {
+            'unknown': ["'unknown' field does not exist."]
+        }
+
+    def test_invalid_values_raise(self, active_fake_obj):
+        with pytest.raises(FreezeConfigurationError) as err:
+            FakeModel.check_edits(
+                [active_fake_obj.pk],
+                {'cannot_change_me': 'maybe', 'unknown': True},
+            )
+
+        assert err.value.message_dict == {
+            'cannot_change_me': [
+                '“maybe” value must be either True or False.'
+            ],
+            'unknown': ["'unknown' field does not exist."],
+        }
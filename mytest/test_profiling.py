@@ -0,0 +1,95 @@
+import pytest
+
+from django_fsm_freeze.exceptions import FreezeValidationError
+from django_fsm_freeze.profiling import FreezeProfile, profile_fsm_freeze
+from mytest.models import NonFSMModel, SubFakeModel, SubSubFakeModel
+
+DELEGATION_PATH = 'sub_fake_model.fake_model'
+
+
+@pytest.fixture
+def sub_sub_fake(active_fake_obj):
+    sub_fake = SubFakeModel.objects.create(
+        fake_model=active_fake_obj,
+        another_model=NonFSMModel.objects.create(),
+    )
+    return SubSubFakeModel.objects.create(sub_fake_model=sub_fake)
+
+
+def get_stats(profile, operation, phase):
+    stats = profile.stats[
+        ('mytest.SubSubFakeModel', DELEGATION_PATH, operation, phase)
+    ]
+    return stats.calls, stats.queries
+
+
+@pytest.mark.django_db
+class TestProfileFsmFreeze:
+    def test_save_phases(self, sub_sub_fake):
+        sub_sub_fake = SubSubFakeModel.objects.get(pk=sub_sub_fake.pk)
+        sub_sub_fake.can_change_me = True
+
+        with profile_fsm_freeze() as profile:
+            sub_sub_fake.save()
+
+        assert {key[2:] for key in profile.stats} == {
+            ('save', 'total'),
+            ('save', 'delegation'),
+            ('save', 'dirty_diffing'),
+            ('save', 'snapshot'),
+        }
+        # select the delegated state, update
+        assert get_stats(profile, 'save', 'total') == (1, 2)
+        assert get_stats(profile, 'save', 'delegation') == (1, 1)
+        assert get_stats(profile, 'save', 'dirty_diffing') == (1, 0)
+        assert get_stats(profile, 'save', 'snapshot') == (1, 0)
+
+    def test_rejected_delete_phases(self, sub_sub_fake):
+        sub_sub_fake = SubSubFakeModel.objects.get(pk=sub_sub_fake.pk)
+        profile = FreezeProfile()
+
+        with pytest.raises(FreezeValidationError):
+            with profile_fsm_freeze(profile):
+                sub_sub_fake.delete()
+
+        assert get_stats(profile, 'delete', 'total') == (1, 1)
+        assert get_stats(profile, 'delete', 'delegation') == (1, 1)
+
+    def test_load_snapshot_is_aggregated(self, sub_sub_fake):
+        with profile_fsm_freeze() as profile:
+            list(SubSubFakeModel.objects.all())
+            list(SubSubFakeModel.objects.all())
+
+        assert get_stats(profile, 'load', 'snapshot') == (2, 0)
+
+    def test_not_profiled_outside_context(self, sub_sub_fake):
+        with profile_fsm_freeze() as profile:
+            pass
+        sub_sub_fake.save()
+
+        assert profile.stats == {}
+
+    def test_summary(self, sub_sub_fake):
+        with profile_fsm_freeze() as profile:
+            sub_sub_fake.save()
+
+        lines = profile.summary(limit=2).splitlines()
+
+        assert lines[0].split() == [
+            'model',
+            'delegation',
+            'path',
+            'operation',
+            'phase',
+            'calls',
+            'seconds',
+            'queries',
+            'allocations',
+        ]
+        assert len(lines) == 3
+        assert lines[1].split()[:4] == [
+            'mytest.SubSubFakeModel',
+            DELEGATION_PATH,
+            'save',
+            'total',
+        ]
@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def django_pytester(pytester, monkeypatch):
+    monkeypatch.setenv('PYTHONPATH', str(ROOT))
+    pytester.makeini(
+        '[pytest]\nDJANGO_SETTINGS_MODULE=my_django_fsm_freeze.settings\n'
+    )
+    return pytester
+
+
+def run_profiled(pytester):
+    return pytester.runpytest_subprocess(
+        '-p', 'django_fsm_freeze.pytest_plugin', '--fsm-freeze-profile'
+    )
+
+
+def test_profile_section(django_pytester):
+    django_pytester.makepyfile("""
+        import pytest
+
+        from mytest.models import FakeModel
+
+
+        @pytest.mark.django_db
+        def test_save():
+            fake_obj = FakeModel.objects.create()
+            fake_obj.activate()
+            fake_obj.save()
+        """)
+
+    result = run_profiled(django_pytester)
+
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(
+        [
+            '*= fsm freeze profile =*',
+            'model * delegation path * operation * phase * calls *',
+            'mytest.FakeModel * save * total * 2 *',
+        ]
+    )
+
+
+def test_no_frozen_checks(django_pytester):
+    django_pytester.makepyfile('def test_nothing():\n    pass\n')
+
+    result = run_profiled(django_pytester)
+
+    result.assert_outcomes(passed=1)
+    result.stdout.fnmatch_lines(
+        ['*= fsm freeze profile =*', 'No frozen checks.']
+    )
+
+
+def test_not_reported_by_default(django_pytester):
+    django_pytester.makepyfile('def test_nothing():\n    pass\n')
+
+    result = django_pytester.runpytest_subprocess(
+        '-p', 'django_fsm_freeze.pytest_plugin'
+    )
+
+    result.assert_outcomes(passed=1)
+    result.stdout.no_fnmatch_line('*fsm freeze profile*')
@@ -0,0 +1,89 @@
+import pytest
+
+from django_fsm_freeze.exceptions import FreezeValidationError
+from mytest.models import FakeModel, SubFakeModel, SubSubFakeModel
+
+
+@pytest.mark.django_db
+class TestFreezableQuerySet:
+    def test_annotate_fsm_frozen(self, fake_objs):
+        new_obj, active_obj = fake_objs
+        sub_subs = [
+            SubSubFakeModel.objects.create(
+                sub_fake_model=SubFakeModel.objects.create(fake_model=obj)
+            )
+            for obj in fake_objs
+        ]
+
+        frozen = dict(
+            SubSubFakeModel.objects.annotate_fsm_frozen().values_list(
+                'pk', 'fsm_frozen'
+            )
+        )
+
+        assert frozen == {sub_subs[0].pk: False, sub_subs[1].pk: True}
+
+    def test_filter_fsm_frozen(self, fake_objs):
+        new_obj, active_obj = fake_objs
+
+        assert list(FakeModel.objects.filter_fsm_frozen()) == [active_obj]
+        assert list(FakeModel.objects.filter_fsm_frozen(False)) == [new_obj]
+
+
+@pytest.mark.django_db
+class TestStreamReadonly:
+    def test_stream_readonly(self, fake_objs, django_assert_num_queries):
+        with django_assert_num_queries(1):
+            objs = list(FakeModel.objects.order_by('pk').stream_readonly())
+
+        assert [obj.is_fsm_frozen for obj in objs] == [False, True]
+        assert not hasattr(objs[0], '_original_state')
+
+    def test_stream_readonly_delegated(
+        self, fake_objs, django_assert_num_queries
+    ):
+        for obj in fake_objs:
+            SubFakeModel.objects.create(fake_model=obj)
+
+        with django_assert_num_queries(1):
+            frozen = [
+                obj.is_fsm_frozen
+                for obj in SubFakeModel.objects.order_by('pk').stream_readonly(
+                    chunk_size=1
+                )
+            ]
+
+        assert frozen == [False, True]
+
+    def test_stream_readonly_cannot_be_written(self, fake_objs):
+        obj = next(FakeModel.objects.stream_readonly())
+
+        with pytest.raises(FreezeValidationError) as err:
+            obj.save()
+        assert err.value.message == f'{obj!r} is read-only, cannot be saved.'
+
+        with pytest.raises(FreezeValidationError) as err:
+            obj.delete()
+        assert err.value.message == f'{obj!r} is read-only, cannot be deleted.'
+
+    def test_related_instances_are_not_read_only(self, fake_objs):
+        for obj in fake_objs:
+            SubFakeModel.objects.create(fake_model=obj)
+
+        objs = list(
+            SubFakeModel.objects.select_related('fake_model')
+            .order_by('pk')
+            .stream_readonly()
+        )
+
+        assert [obj.fake_model.is_fsm_frozen for obj in objs] == [False, True]
+        objs[0].fake_model.can_change_me = True
+        objs[0].fake_model.save()  # no error raised
+
+    def test_instances_loaded_while_streaming_are_writable(self, fake_objs):
+        for obj in FakeModel.objects.stream_readonly():
+            loaded = FakeModel.objects.get(pk=obj.pk)
+            loaded.can_change_me = True
+            loaded.save()  # no error raised
+
+        assert FakeModel.objects.filter(can_change_me=True).count() == 2
@@ -0,0 +1,96 @@
+import pytest
+from rest_framework import serializers
+
+from django_fsm_freeze.models import bypass_fsm_freeze
+from django_fsm_freeze.rest_framework import (
+    FreezableListSerializer,
+    FreezableSerializerMixin,
+)
+from mytest.models import SubFakeModel
+
+
+class SubFakeSerializer(FreezableSerializerMixin, serializers.ModelSerializer):
+    class Meta:
+        model = SubFakeModel
+        fields = ('id', 'fake_model', 'can_change_me', 'cannot_change_me')
+        list_serializer_class = FreezableListSerializer
+
+
+@pytest.mark.django_db
+class TestFreezableSerializer:
+    def test_frozen_field_change_is_invalid(self, fake_objs):
+        sub_fake = SubFakeModel.objects.create(fake_model=fake_objs[1])
+
+        serializer = SubFakeSerializer(
+            sub_fake,
+            data={'can_change_me': True, 'cannot_change_me': True},
+            partial=True,
+        )
+
+        assert not serializer.is_valid()
+        assert serializer.errors == {
+            'cannot_change_me': ['Cannot change frozen field.']
+        }
+
+    def test_unchanged_frozen_field_is_valid(
+        self, fake_objs, django_assert_num_queries
+    ):
+        sub_fake = SubFakeModel.objects.create(fake_model=fake_objs[1])
+
+        serializer = SubFakeSerializer(
+            sub_fake,
+            data={'can_change_me': True, 'cannot_change_me': False},
+            partial=True,
+        )
+
+        # the frozeness is not resolved
+        with django_assert_num_queries(0):
+            assert serializer.is_valid()
+
+    def test_bypassed(self, fake_objs):
+        sub_fake = SubFakeModel.objects.create(fake_model=fake_objs[1])
+
+        with bypass_fsm_freeze(sub_fake):
+            serializer = SubFakeSerializer(
+                sub_fake, data={'cannot_change_me': True}, partial=True
+            )
+            assert serializer.is_valid()
+
+    def test_not_frozen(self, fake_objs):
+        sub_fake = SubFakeModel.objects.create(fake_model=fake_objs[0])
+
+        serializer = SubFakeSerializer(
+            sub_fake, data={'cannot_change_me': True}, partial=True
+        )
+
+        assert serializer.is_valid()
+
+    def test_many(self, fake_objs, django_assert_num_queries):
+        sub_fakes = [
+            SubFakeModel.objects.create(fake_model=fake_objs[i % 2])
+            for i in range(4)
+        ]
+        SubFakeModel.objects.filter(pk=sub_fakes[0].pk).update(
+            cannot_change_me=True
+        )
+        sub_fakes = list(SubFakeModel.objects.order_by('pk'))
+
+        serializer = SubFakeSerializer(
+            sub_fakes,
+            data=[{'cannot_change_me': False}, {'cannot_change_me': True}]
+            + [{'can_change_me': True}] * 2,
+            many=True,
+            partial=True,
+        )
+
+        with django_assert_num_queries(1):
+            assert not serializer.is_valid()
+        errors = serializer.errors
+        if isinstance(errors, dict):
+            errors = [errors.get(index, {}) for index in range(4)]
+        assert errors == [
+            {},
+            {'cannot_change_me': ['Cannot change frozen field.']},
+            {},
+            {},
+        ]
@@ -0,0 +1,152 @@
+import pytest
+from django.db import transaction
+
+from django_fsm_freeze.signals import (
+    frozen_state_changed,
+    get_frozen_dependents,
+)
+from mytest.models import FakeModel, FakeStates, SubFakeModel, SubSubFakeModel
+
+
+@pytest.fixture
+def received():
+    calls = []
+
+    def receiver(sender, **kwargs):
+        calls.append((sender, kwargs))
+
+    frozen_state_changed.connect(receiver)
+    yield calls
+    frozen_state_changed.disconnect(receiver)
+
+
+def test_reverse_delegation_index():
+    assert get_frozen_dependents(FakeModel) == (
+        (SubFakeModel, 'fake_model'),
+        (SubSubFakeModel, 'sub_fake_model__fake_model'),
+    )
+    assert get_frozen_dependents(SubFakeModel) == ()
+
+
+@pytest.mark.django_db
+class TestFrozenStateChanged:
+    def test_sent_on_commit_once_per_transaction(
+        self, received, django_capture_on_commit_callbacks
+    ):
+        fake_objs = [FakeModel.objects.create() for _ in range(3)]
+
+        with django_capture_on_commit_callbacks(execute=True):
+            for fake_obj in fake_objs:
+                fake_obj.activate()
+                fake_obj.save()
+            assert received == []
+
+        assert received == [
+            (
+                FakeModel,
+                {
+                    'signal': frozen_state_changed,
+                    'pks': frozenset(fake_obj.pk for fake_obj in fake_objs),
+                    'frozen': True,
+                    'using': 'default',
+                    'dependents': get_frozen_dependents(FakeModel),
+                },
+            )
+        ]
+
+    def test_not_sent_within_frozen_states(
+        self, received, django_capture_on_commit_callbacks
+    ):
+        fake_obj = FakeModel.objects.create()
+        fake_obj.activate()
+        fake_obj.save()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            fake_obj.archive()
+            fake_obj.can_change_me = True
+            fake_obj.save()
+
+        assert received == []
+
+    def test_coalesced_back_to_initial_frozeness(
+        self, received, django_capture_on_commit_callbacks
+    ):
+        fake_obj = FakeModel.objects.create()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            fake_obj.activate()
+            fake_obj.save()
+            fake_obj.state = FakeStates.NEW.value
+            fake_obj.save()
+
+        assert received == []
+
+    def test_not_sent_on_rollback(
+        self, received, django_capture_on_commit_callbacks
+    ):
+        fake_obj = FakeModel.objects.create()
+        another_fake_obj = FakeModel.objects.create()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    fake_obj.activate()
+                    fake_obj.save()
+                    raise RuntimeError
+            another_fake_obj.activate()
+            another_fake_obj.save()
+
+        assert [kwargs['pks'] for _, kwargs in received] == [
+            frozenset([another_fake_obj.pk])
+        ]
+
+    def test_not_sent_on_savepoint_rollback(
+        self, received, django_capture_on_commit_callbacks
+    ):
+        fake_obj = FakeModel.objects.create()
+        another_fake_obj = FakeModel.objects.create()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            fake_obj.activate()
+            fake_obj.save()
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    another_fake_obj.activate()
+                    another_fake_obj.save()
+                    raise RuntimeError
+
+        assert [kwargs['pks'] for _, kwargs in received] == [
+            frozenset([fake_obj.pk])
+        ]
+
+    def test_not_sent_when_savepoint_rolled_back_first(
+        self, received, django_capture_on_commit_callbacks
+    ):
+        fake_obj = FakeModel.objects.create()
+        another_fake_obj = FakeModel.objects.create()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            with pytest.raises(RuntimeError):
+                with transaction.atomic():
+                    fake_obj.activate()
+                    fake_obj.save()
+                    raise RuntimeError
+
+        with django_capture_on_commit_callbacks(execute=True):
+            another_fake_obj.activate()
+            another_fake_obj.save()
+
+        assert [kwargs['pks'] for _, kwargs in received] == [
+            frozenset([another_fake_obj.pk])
+        ]
+
+    def test_not_sent_when_state_not_saved(
+        self, received, django_capture_on_commit_callbacks
+    ):
+        fake_obj = FakeModel.objects.create()
+
+        with django_capture_on_commit_callbacks(execute=True):
+            fake_obj.activate()
+            fake_obj.save(update_fields=['can_change_me'])
+
+        assert received == []